@@ -5,14 +5,18 @@ Full wiki-style editing capabilities with PostgreSQL persistence
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.figure_factory as ff
+import functools
 import json
+import math
 import os
 from datetime import datetime, timedelta
-from workplan_db_processor import initialize_workplan_db_manager, TaskStatus, TaskPriority
+from workplan_db_processor import get_workplan_manager, TaskStatus, TaskPriority
+
+# Selectbox options and value-to-index lookups, built once at import
+TASK_STATUS_VALUES = tuple(status.value for status in TaskStatus)
+TASK_STATUS_INDEX = {value: i for i, value in enumerate(TASK_STATUS_VALUES)}
+TASK_PRIORITY_VALUES = tuple(priority.value for priority in TaskPriority)
+TASK_PRIORITY_INDEX = {value: i for i, value in enumerate(TASK_PRIORITY_VALUES)}
 
 # Configure Streamlit page
 st.set_page_config(
@@ -26,16 +30,17 @@ st.set_page_config(
 if 'theme' not in st.session_state:
     st.session_state.theme = 'system'
 
-def apply_theme():
+def apply_theme(theme=None):
     """Apply selected theme"""
-    if st.session_state.theme == 'dark':
+    theme = theme or st.session_state.theme
+    if theme == 'dark':
         theme_colors = {
             'bg_color': '#1e1e1e',
             'text_color': '#ffffff', 
             'card_bg': '#2d2d2d',
             'border_color': '#404040'
         }
-    elif st.session_state.theme == 'light':
+    elif theme == 'light':
         theme_colors = {
             'bg_color': '#ffffff',
             'text_color': '#000000',
@@ -51,10 +56,11 @@ def apply_theme():
         }
     return theme_colors
 
-# Apply theme and custom CSS
-theme_colors = apply_theme()
-
-st.markdown(f"""
+@functools.lru_cache(maxsize=None)
+def theme_markup(theme):
+    """Build the custom CSS and cloud indicator markup for a theme once"""
+    theme_colors = apply_theme(theme)
+    return f"""
 <style>
     .metric-container {{
         background-color: {theme_colors['card_bg']};
@@ -132,10 +138,11 @@ st.markdown(f"""
         z-index: 999;
     }}
 </style>
-""", unsafe_allow_html=True)
+<div class="cloud-indicator">☁️ Cloud Ready</div>
+"""
 
-# Cloud deployment indicator
-st.markdown('<div class="cloud-indicator">☁️ Cloud Ready</div>', unsafe_allow_html=True)
+# Apply theme, custom CSS and the cloud deployment indicator in one element
+st.markdown(theme_markup(st.session_state.theme), unsafe_allow_html=True)
 
 def render_theme_selector():
     """Render theme selector in sidebar"""
@@ -168,50 +175,40 @@ def render_theme_selector():
         st.session_state.theme = new_theme
         st.rerun()
 
-def inline_text_edit(label, current_value, key, manager=None, update_func=None):
-    """Create an inline editable text field with database persistence"""
-    # Initialize editing state
-    edit_key = f"editing_{key}"
-    if edit_key not in st.session_state:
-        st.session_state[edit_key] = False
-    
-    col1, col2 = st.columns([6, 1])
-    
-    with col2:
-        if st.session_state[edit_key]:
-            if st.button("💾", key=f"save_{key}", help="Save changes"):
-                new_value = st.session_state.get(f"input_{key}", current_value)
-                if update_func and manager and new_value != current_value:
-                    success = update_func(manager, new_value)
-                    if success:
-                        st.success(f"✅ Updated {label}!")
-                    else:
-                        st.error(f"❌ Failed to update {label}")
-                st.session_state[edit_key] = False
-                st.rerun()
-        else:
-            if st.button("✏️", key=f"edit_{key}", help=f"Edit {label}"):
-                st.session_state[edit_key] = True
-                st.session_state[f"input_{key}"] = current_value
-                st.rerun()
-    
-    with col1:
-        if st.session_state[edit_key]:
-            new_value = st.text_input(
-                f"Edit {label}",
-                value=st.session_state.get(f"input_{key}", current_value),
-                key=f"input_{key}",
-                label_visibility="collapsed"
-            )
-            st.session_state[f"input_{key}"] = new_value
+def _start_inline_edit(key, value_key, current_value):
+    """Button callback: switch a field into edit mode seeded with its value"""
+    st.session_state[f"editing_{key}"] = True
+    st.session_state[value_key] = current_value
+
+def _save_inline_edit(label, key, value_key, current_value, manager, update_func):
+    """Button callback: persist an inline edit and leave edit mode"""
+    new_value = st.session_state.get(value_key, current_value)
+    if update_func and manager and new_value != current_value:
+        if update_func(manager, new_value):
+            st.session_state[f"flash_{key}"] = ("success", f"✅ Updated {label}!")
         else:
-            st.write(f"**{current_value}**")
+            st.session_state[f"flash_{key}"] = ("error", f"❌ Failed to update {label}")
+    st.session_state[f"editing_{key}"] = False
+
+def _render_inline_edit_button(label, current_value, key, value_key, manager, update_func):
+    """Render the edit/save toggle button and any message from the last save"""
+    # Buttons flip state in on_click callbacks, which run before the rerun
+    # their click triggers, so no explicit st.rerun() is needed
+    if st.session_state[f"editing_{key}"]:
+        st.button("💾", key=f"save_{key}", help="Save changes",
+                  on_click=_save_inline_edit,
+                  args=(label, key, value_key, current_value, manager, update_func))
+    else:
+        st.button("✏️", key=f"edit_{key}", help=f"Edit {label}",
+                  on_click=_start_inline_edit, args=(key, value_key, current_value))
     
-    return current_value
+    flash = st.session_state.pop(f"flash_{key}", None)
+    if flash:
+        level, message = flash
+        getattr(st, level)(message)
 
-def inline_text_area_edit(label, current_value, key, manager=None, update_func=None):
-    """Create an inline editable text area field with database persistence"""
-    # Initialize editing state
+def _render_inline_field(label, current_value, key, value_key, manager, update_func, render_input, render_value):
+    """Render one inline editable field: value or input on the left, edit/save button on the right"""
     edit_key = f"editing_{key}"
     if edit_key not in st.session_state:
         st.session_state[edit_key] = False
@@ -219,120 +216,160 @@ def inline_text_area_edit(label, current_value, key, manager=None, update_func=N
     col1, col2 = st.columns([6, 1])
     
     with col2:
-        if st.session_state[edit_key]:
-            if st.button("💾", key=f"save_{key}", help="Save changes"):
-                new_value = st.session_state.get(f"textarea_{key}", current_value)
-                if update_func and manager and new_value != current_value:
-                    success = update_func(manager, new_value)
-                    if success:
-                        st.success(f"✅ Updated {label}!")
-                    else:
-                        st.error(f"❌ Failed to update {label}")
-                st.session_state[edit_key] = False
-                st.rerun()
-        else:
-            if st.button("✏️", key=f"edit_{key}", help=f"Edit {label}"):
-                st.session_state[edit_key] = True
-                st.session_state[f"textarea_{key}"] = current_value
-                st.rerun()
+        _render_inline_edit_button(label, current_value, key, value_key, manager, update_func)
     
     with col1:
         if st.session_state[edit_key]:
-            new_value = st.text_area(
-                f"Edit {label}",
-                value=st.session_state.get(f"textarea_{key}", current_value),
-                key=f"textarea_{key}",
-                label_visibility="collapsed",
-                height=100
-            )
-            st.session_state[f"textarea_{key}"] = new_value
+            render_input(f"Edit {label}", key=value_key, label_visibility="collapsed")
         else:
-            st.write(current_value)
+            render_value(current_value)
     
     return current_value
 
-@st.cache_resource
+def inline_text_edit(label, current_value, key, manager=None, update_func=None):
+    """Create an inline editable text field with database persistence"""
+    return _render_inline_field(
+        label, current_value, key, f"input_{key}", manager, update_func,
+        render_input=st.text_input,
+        render_value=lambda value: st.write(f"**{value}**")
+    )
+
+def inline_text_area_edit(label, current_value, key, manager=None, update_func=None):
+    """Create an inline editable text area field with database persistence"""
+    return _render_inline_field(
+        label, current_value, key, f"textarea_{key}", manager, update_func,
+        render_input=functools.partial(st.text_area, height=100),
+        render_value=st.write
+    )
+
 def load_workplan_data():
-    """Load and cache workplan database manager"""
+    """Load the shared, cached workplan database manager"""
     try:
-        manager = initialize_workplan_db_manager()
+        manager = get_workplan_manager()
         return manager
     except Exception as e:
         st.error(f"Error loading workplan data: {e}")
         return None
 
-def create_category_overview_chart(manager):
-    """Create overview chart showing category progress"""
-    categories = manager.get_all_categories()
-    
-    category_names = []
-    estimated_hours = []
-    actual_hours = []
-    completion_percentages = []
-    
-    for category_name, category_data in categories.items():
-        progress = manager.calculate_category_progress(category_name)
-        category_names.append(category_name.replace(" (2)", "").replace(" (1)", ""))
-        estimated_hours.append(progress["estimated_hours"])
-        actual_hours.append(progress["actual_hours"])
-        completion_percentages.append(progress["completion_percentage"])
-    
-    # Create subplot with secondary y-axis
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=('Hours Breakdown', 'Completion Progress'),
-        specs=[[{"secondary_y": False}, {"secondary_y": False}]]
+@st.cache_data(ttl=60)
+def tasks_dataframe(data_version, _manager):
+    """Build one flat DataFrame of task fields per data version"""
+    return pd.DataFrame(
+        [
+            (task.id, task.title, task.category, task.status.value, task.priority.value,
+             task.estimated_hours or 0, task.actual_hours or 0, task.completion_percentage)
+            for task in _manager.tasks.values()
+        ],
+        columns=['id', 'title', 'category', 'status', 'priority',
+                 'estimated_hours', 'actual_hours', 'completion_percentage']
+    )
+
+@st.cache_data(ttl=60)
+def _compute_category_overview(data_version, _manager):
+    """Aggregate per-category hours and completion for the overview chart"""
+    df = tasks_dataframe(data_version, _manager)
+    grouped = (
+        df.assign(completed=df['status'] == TaskStatus.COMPLETED.value)
+        .groupby('category')
+        .agg(
+            estimated_hours=('estimated_hours', 'sum'),
+            actual_hours=('actual_hours', 'sum'),
+            completion_percentage=('completed', 'mean')
+        )
+        .reindex(list(_manager.categories.keys()), fill_value=0)
     )
     
+    category_names = [name.replace(" (2)", "").replace(" (1)", "") for name in grouped.index]
+    estimated_hours = grouped['estimated_hours'].tolist()
+    actual_hours = grouped['actual_hours'].tolist()
+    completion_percentages = (grouped['completion_percentage'] * 100).tolist()
+    
+    return category_names, estimated_hours, actual_hours, completion_percentages
+
+@st.cache_data(ttl=60)
+def _compute_status_counts(data_version, _manager):
+    """Count tasks per status for the status pie chart"""
+    return dict(_manager.get_status_counts().most_common())
+
+@st.cache_data(ttl=30)
+def _load_dashboard_snapshot(data_version, _manager):
+    """Load project summary and category details once per data version"""
+    return _manager.load_dashboard_snapshot()
+
+@st.cache_data(ttl=30)
+def _query_tasks(data_version, _manager, category=None, status=None, priority=None, limit=None, offset=None):
+    """Fetch one filtered page of tasks once per data version"""
+    return _manager.query_tasks(category, status, priority, limit=limit, offset=offset)
+
+@st.cache_data(ttl=60)
+def _category_overview_figure_json(data_version, _manager):
+    """Build the category hours and completion figures once per data version, as JSON"""
+    # Plotly is only needed on the overview page, so import it on first use
+    import plotly.graph_objects as go
+    
+    category_names, estimated_hours, actual_hours, completion_percentages = \
+        _compute_category_overview(data_version, _manager)
+    
     # Hours chart
-    fig.add_trace(
-        go.Bar(name='Estimated Hours', x=category_names, y=estimated_hours, 
+    hours_fig = go.Figure([
+        go.Bar(name='Estimated Hours', x=category_names, y=estimated_hours,
                marker_color='lightblue', offsetgroup=1),
-        row=1, col=1
-    )
-    fig.add_trace(
         go.Bar(name='Actual Hours', x=category_names, y=actual_hours,
-               marker_color='darkblue', offsetgroup=2),
-        row=1, col=1
-    )
+               marker_color='darkblue', offsetgroup=2)
+    ])
+    hours_fig.update_layout(title_text="Hours Breakdown", height=500, showlegend=True)
     
     # Completion chart
-    fig.add_trace(
+    completion_fig = go.Figure(
         go.Bar(name='Completion %', x=category_names, y=completion_percentages,
                marker_color='green', text=[f'{x:.1f}%' for x in completion_percentages],
-               textposition='outside'),
-        row=1, col=2
+               textposition='outside')
     )
+    completion_fig.update_layout(title_text="Completion Progress", height=500)
     
-    fig.update_layout(
-        title_text="Category Overview Dashboard",
-        height=500,
-        showlegend=True
-    )
+    return hours_fig.to_json(), completion_fig.to_json()
+
+# Slice colors for the task status pie chart
+STATUS_COLORS = {
+    'Not Started': '#ff6b6b',
+    'In Progress': '#feca57',
+    'Completed': '#48cab2',
+    'Blocked': '#ff9ff3',
+    'On Hold': '#a55eea'
+}
+
+@st.cache_data(ttl=60)
+def _task_status_pie_figure_json(data_version, _manager):
+    """Build the task status pie figure once per data version, as JSON"""
+    import plotly.graph_objects as go
+    
+    status_counts = _compute_status_counts(data_version, _manager)
+    
+    if status_counts:
+        fig = go.Figure(go.Pie(
+            labels=list(status_counts),
+            values=list(status_counts.values()),
+            marker=dict(colors=[STATUS_COLORS[status] for status in status_counts])
+        ))
+        # Keep the same uirevision across reruns so the client updates the chart in place
+        fig.update_layout(title_text="Task Status Distribution", uirevision="status_pie")
+        return fig.to_json()
+    return None
+
+def create_category_overview_chart(manager):
+    """Create the hours and completion charts showing category progress"""
+    import plotly.graph_objects as go
     
-    return fig
+    hours_json, completion_json = _category_overview_figure_json(manager.data_version, manager)
+    return go.Figure(json.loads(hours_json)), go.Figure(json.loads(completion_json))
 
 def create_task_status_pie_chart(manager):
     """Create pie chart showing task status distribution"""
-    status_counts = {}
-    for task in manager.tasks.values():
-        status = task.status.value
-        status_counts[status] = status_counts.get(status, 0) + 1
+    import plotly.graph_objects as go
     
-    if status_counts:
-        fig = px.pie(
-            values=list(status_counts.values()),
-            names=list(status_counts.keys()),
-            title="Task Status Distribution",
-            color_discrete_map={
-                'Not Started': '#ff6b6b',
-                'In Progress': '#feca57',
-                'Completed': '#48cab2',
-                'Blocked': '#ff9ff3',
-                'On Hold': '#a55eea'
-            }
-        )
-        return fig
+    figure_json = _task_status_pie_figure_json(manager.data_version, manager)
+    if figure_json:
+        return go.Figure(json.loads(figure_json))
     return None
 
 def update_task_title_wrapper(manager, task_id, new_title):
@@ -343,7 +380,16 @@ def update_task_description_wrapper(manager, task_id, new_description):
     """Wrapper for updating task description"""
     return manager.update_task_description(task_id, new_description)
 
-def render_task_details(manager, task_id):
+def prefetch_dependencies(manager, tasks):
+    """Fetch every dependency of the given tasks in a single batch"""
+    dependency_ids = {
+        dep
+        for task in tasks
+        for dep in task.dependencies or []
+    }
+    return manager.get_tasks_by_ids(dependency_ids)
+
+def render_task_details(manager, task_id, prefetched=None):
     """Render detailed task view with full database-backed inline editing"""
     task = manager.get_task_by_id(task_id)
     if not task:
@@ -389,48 +435,45 @@ def render_task_details(manager, task_id):
     with col2:
         st.write("**Task Management:**")
         
-        # Status update
-        current_status = task.status.value
-        new_status = st.selectbox(
-            "Status",
-            options=[status.value for status in TaskStatus],
-            index=[status.value for status in TaskStatus].index(current_status),
-            key=f"status_{task_id}"
-        )
-        
-        if new_status != current_status:
-            manager.update_task_status(task_id, TaskStatus(new_status))
-            changes_made = True
-            st.success("✅ Status updated!")
-        
-        # Completion percentage
-        completion = st.slider(
-            "Completion %",
-            min_value=0.0,
-            max_value=100.0,
-            value=task.completion_percentage,
-            step=5.0,
-            key=f"completion_{task_id}"
-        )
-        
-        if completion != task.completion_percentage:
-            manager.update_task_status(task_id, task.status, completion)
-            changes_made = True
-            st.success("✅ Progress updated!")
-        
-        # Hours tracking
-        estimated_hours = task.estimated_hours or 0
-        actual_hours = st.number_input(
-            f"Actual Hours (Est: {estimated_hours}h)",
-            min_value=0,
-            value=task.actual_hours or 0,
-            key=f"hours_{task_id}"
-        )
+        # Batch status, progress and hours into one save so dragging the
+        # slider or typing hours doesn't write to the database on every tick
+        with st.form(f"mgmt_{task_id}"):
+            # Status update
+            current_status = task.status.value
+            new_status = st.selectbox(
+                "Status",
+                options=TASK_STATUS_VALUES,
+                index=TASK_STATUS_INDEX[current_status],
+                key=f"status_{task_id}"
+            )
+            
+            # Completion percentage
+            completion = st.slider(
+                "Completion %",
+                min_value=0.0,
+                max_value=100.0,
+                value=task.completion_percentage,
+                step=5.0,
+                key=f"completion_{task_id}"
+            )
+            
+            # Hours tracking
+            estimated_hours = task.estimated_hours or 0
+            actual_hours = st.number_input(
+                f"Actual Hours (Est: {estimated_hours}h)",
+                min_value=0,
+                value=task.actual_hours or 0,
+                key=f"hours_{task_id}"
+            )
+            
+            submitted = st.form_submit_button("💾 Save")
         
-        if actual_hours != (task.actual_hours or 0):
-            manager.update_task_hours(task_id, actual_hours)
+        if submitted and (new_status != current_status
+                          or completion != task.completion_percentage
+                          or actual_hours != (task.actual_hours or 0)):
+            manager.update_task_bulk(task_id, TaskStatus(new_status), completion, actual_hours)
             changes_made = True
-            st.success("✅ Hours updated!")
+            st.success("✅ Task updated!")
         
         # Progress bar
         st.progress(completion / 100.0)
@@ -439,7 +482,7 @@ def render_task_details(manager, task_id):
         if task.dependencies:
             st.write("**Dependencies:**")
             for dep in task.dependencies:
-                dep_task = manager.get_task_by_id(dep)
+                dep_task = prefetched.get(dep) if prefetched is not None else manager.get_task_by_id(dep)
                 if dep_task:
                     dep_status = "✅" if dep_task.status == TaskStatus.COMPLETED else "⏳"
                     st.write(f"{dep_status} {dep}: {dep_task.title}")
@@ -447,6 +490,14 @@ def render_task_details(manager, task_id):
     st.markdown('</div>', unsafe_allow_html=True)
     return changes_made
 
+def render_task_cards(manager, tasks, show_id=True):
+    """Render task cards that only build their detail widgets while open"""
+    dependencies = prefetch_dependencies(manager, tasks)
+    for task in tasks:
+        label = f"🎯 {task.id}: {task.title}" if show_id else f"🎯 {task.title}"
+        if st.toggle(label, key=f"open_{task.id}"):
+            render_task_details(manager, task.id, dependencies)
+
 def render_new_task_form(manager):
     """Render form to create new tasks with database persistence"""
     st.subheader("➕ Create New Task")
@@ -465,8 +516,8 @@ def render_new_task_form(manager):
             )
             priority = st.selectbox(
                 "Priority",
-                options=["High", "Medium", "Low"],
-                index=1
+                options=TASK_PRIORITY_VALUES,
+                index=TASK_PRIORITY_INDEX[TaskPriority.MEDIUM.value]
             )
             estimated_hours = st.number_input(
                 "Estimated Hours",
@@ -508,13 +559,14 @@ def main():
     render_theme_selector()
     
     # Database status indicator
-    if manager.db.connection:
+    if manager.db.pool:
         st.sidebar.success("🟢 Database Connected")
     else:
         st.sidebar.warning("🟡 Using Demo Mode")
     
     # Get project summary
-    summary = manager.get_project_summary()
+    snapshot = _load_dashboard_snapshot(manager.data_version, manager)
+    summary = snapshot['summary']
     
     # Display key metrics in sidebar
     st.sidebar.markdown("### 📊 Project Metrics")
@@ -569,15 +621,18 @@ def main():
             )
         
         # Charts row
-        col1, col2 = st.columns(2)
+        col1, col2, col3 = st.columns(3)
+        
+        # Category overview charts
+        hours_chart, completion_chart = create_category_overview_chart(manager)
         
         with col1:
-            # Category overview chart
-            overview_chart = create_category_overview_chart(manager)
-            if overview_chart:
-                st.plotly_chart(overview_chart, use_container_width=True)
+            st.plotly_chart(hours_chart, use_container_width=True)
         
         with col2:
+            st.plotly_chart(completion_chart, use_container_width=True)
+        
+        with col3:
             # Task status pie chart
             status_chart = create_task_status_pie_chart(manager)
             if status_chart:
@@ -614,43 +669,59 @@ def main():
         with col1:
             category_filter = st.selectbox(
                 "Filter by Category",
-                options=["All"] + list(manager.get_all_categories().keys())
+                options=["All"] + list(snapshot['categories'].keys())
             )
         
         with col2:
             status_filter = st.selectbox(
                 "Filter by Status",
-                options=["All"] + [status.value for status in TaskStatus]
+                options=("All",) + TASK_STATUS_VALUES
             )
         
         with col3:
             priority_filter = st.selectbox(
                 "Filter by Priority",
-                options=["All"] + [priority.value for priority in TaskPriority]
+                options=("All",) + TASK_PRIORITY_VALUES
+            )
+        
+        # Paginate so only the visible page of task cards is fetched and rendered
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            page_size = st.selectbox("Per page", options=[10, 25, 50], index=1)
+        
+        filters = {
+            "category": None if category_filter == "All" else category_filter,
+            "status": None if status_filter == "All" else status_filter,
+            "priority": None if priority_filter == "All" else priority_filter,
+        }
+        page_key = f"page_{category_filter}_{status_filter}_{priority_filter}"
+        page = st.session_state.get(page_key, 1)
+        page_tasks, total_tasks = _query_tasks(
+            manager.data_version, manager, **filters,
+            limit=page_size, offset=(page - 1) * page_size
+        )
+        
+        page_count = max(1, math.ceil(total_tasks / page_size))
+        if page > page_count:
+            page = st.session_state[page_key] = page_count
+            page_tasks, total_tasks = _query_tasks(
+                manager.data_version, manager, **filters,
+                limit=page_size, offset=(page - 1) * page_size
             )
         
-        # Filter tasks
-        filtered_tasks = []
-        for task in manager.tasks.values():
-            if category_filter != "All" and task.category != category_filter:
-                continue
-            if status_filter != "All" and task.status.value != status_filter:
-                continue
-            if priority_filter != "All" and task.priority.value != priority_filter:
-                continue
-            filtered_tasks.append(task)
+        with col2:
+            st.number_input("Page", min_value=1, max_value=page_count, step=1, key=page_key)
         
-        st.write(f"Showing {len(filtered_tasks)} tasks")
+        st.write(f"Showing {total_tasks} tasks")
         
         # Display filtered tasks
-        for task in filtered_tasks:
-            with st.expander(f"🎯 {task.id}: {task.title}", expanded=False):
-                render_task_details(manager, task.id)
+        render_task_cards(manager, page_tasks)
                 
     elif selected_view == "📊 Category Details":
         st.header("📊 Category Details")
         
-        categories = manager.get_all_categories()
+        categories = snapshot['categories']
         selected_category = st.selectbox(
             "Select Category",
             options=list(categories.keys())
@@ -658,7 +729,7 @@ def main():
         
         if selected_category:
             category_data = categories[selected_category]
-            progress = manager.calculate_category_progress(selected_category)
+            progress = summary['categories'][selected_category]
             
             st.markdown(f'<div class="category-header">{selected_category}</div>', 
                        unsafe_allow_html=True)
@@ -683,12 +754,9 @@ def main():
             # Category tasks
             st.subheader(f"Tasks in {selected_category}")
             
-            category_tasks = [task for task in manager.tasks.values() 
-                            if task.category == selected_category]
+            category_tasks, _ = _query_tasks(manager.data_version, manager, category=selected_category)
             
-            for task in category_tasks:
-                with st.expander(f"🎯 {task.title}", expanded=False):
-                    render_task_details(manager, task.id)
+            render_task_cards(manager, category_tasks, show_id=False)
     
     # Footer
     st.sidebar.markdown("---")
@@ -4,15 +4,31 @@ Handles comprehensive task management with PostgreSQL backend
 """
 
 import os
+import csv
+import io
+import functools
+import itertools
+import threading
+import numpy as np
+import pandas as pd
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from contextlib import contextmanager
 import json
+from collections import Counter, defaultdict
 from typing import Dict, List, Tuple, Any, Optional
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
+from types import MappingProxyType
 import streamlit as st
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy reductions are used instead
+    njit = None
+
 class TaskPriority(Enum):
     HIGH = "High"
     MEDIUM = "Medium"
@@ -25,7 +41,7 @@ class TaskStatus(Enum):
     BLOCKED = "Blocked"
     ON_HOLD = "On Hold"
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: str
     title: str
@@ -50,103 +66,707 @@ class Task:
             self.dependencies = []
         if self.subtasks is None:
             self.subtasks = []
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
+    
+    @classmethod
+    def _from_row(cls, row) -> 'Task':
+        """Build a Task from a tasks table row, skipping __init__ and __post_init__"""
+        task = cls.__new__(cls)
+        task.id = row['id']
+        task.title = row['title']
+        task.description = row['description'] or ''
+        task.category = row['category']
+        task.priority = TaskPriority(row['priority'])
+        task.status = TaskStatus(row['status'])
+        task.start_date = row['start_date']
+        task.end_date = row['end_date']
+        task.estimated_hours = row['estimated_hours']
+        task.actual_hours = row['actual_hours']
+        task.dependencies = row['dependencies'] or []
+        task.assigned_to = row['assigned_to']
+        task.completion_percentage = row['completion_percentage']
+        task.notes = row['notes'] or ''
+        task.subtasks = row['subtasks'] or []
+        task.created_at = row['created_at']
+        task.updated_at = row['updated_at']
+        return task
+
+# Default workplan tasks - all 20 tasks, shared read-only by every manager
+_DEFAULT_TASKS_DATA = (
+    # Business Operations Development tasks (8 tasks)
+    {
+        "id": "BO001",
+        "title": "Business Requirements Assessment",
+        "description": "Assess and consolidate program needs and future state business requirements to operate at significantly higher scale",
+        "category": "Business Operations Development (2)",
+        "priority": TaskPriority.HIGH,
+        "estimated_hours": 40,
+        "subtasks": ("Conduct stakeholder interviews", "Document current state processes", "Identify scaling bottlenecks", "Define future state requirements", "Create requirements consolidation report")
+    },
+    {
+        "id": "BO002", 
+        "title": "Future State Operating Model",
+        "description": "Build on prior assessments to finalize target future state business operating model and implementation plans for each business discipline",
+        "category": "Business Operations Development (2)",
+        "priority": TaskPriority.HIGH,
+        "estimated_hours": 60,
+        "subtasks": ("Review prior assessment findings", "Design target operating model", "Create discipline-specific implementation plans", "Define organizational structure", "Document process flows")
+    },
+    {
+        "id": "BO003",
+        "title": "Business Discipline Maturity Framework",
+        "description": "Codify requisite business discipline maturity, with associated 'heatmap' to prioritize development",
+        "category": "Business Operations Development (2)",
+        "priority": TaskPriority.HIGH,
+        "estimated_hours": 32,
+        "subtasks": ("Define maturity levels for each discipline", "Assess current maturity state", "Create maturity heatmap", "Prioritize development areas", "Document maturity framework")
+    },
+    {
+        "id": "BO004",
+        "title": "Implementation Plan Execution",
+        "description": "Support implementation plan execution, with initial emphasis on HR, technology, and contract compliance",
+        "category": "Business Operations Development (2)",
+        "priority": TaskPriority.HIGH,
+        "estimated_hours": 80,
+        "subtasks": ("Establish HR implementation workstream", "Launch technology upgrade initiatives", "Implement contract compliance framework", "Monitor implementation progress", "Provide ongoing execution support")
+    },
+    {
+        "id": "BO005",
+        "title": "Progress Monitoring & Reporting",
+        "description": "Monitor, evaluate, and report implementation progress",
+        "category": "Business Operations Development (2)",
+        "priority": TaskPriority.MEDIUM,
+        "estimated_hours": 24,
+        "subtasks": ("Establish progress tracking metrics", "Create reporting templates", "Conduct weekly progress reviews", "Generate monthly progress reports", "Present findings to leadership")
+    },
+    {
+        "id": "BO006",
+        "title": "Business Operations Rhythm",
+        "description": "Establish long-term business operations operating rhythm, to include governance, decision rights, and meeting/decision cadence",
+        "category": "Business Operations Development (2)",
+        "priority": TaskPriority.MEDIUM,
+        "estimated_hours": 36,
+        "subtasks": ("Design governance structure", "Define decision rights matrix", "Establish meeting cadences", "Create decision-making processes", "Document operating rhythm")
+    },
+    {
+        "id": "BO007",
+        "title": "Risk & Opportunity Register",
+        "description": "Document and codify risk and opportunity register for regular Client leadership review",
+        "category": "Business Operations Development (2)",
+        "priority": TaskPriority.MEDIUM,
+        "estimated_hours": 28,
+        "subtasks": ("Identify program risks and opportunities", "Create risk assessment framework", "Establish opportunity evaluation process", "Document register format", "Schedule regular leadership reviews")
+    },
+    {
+        "id": "BO008",
+        "title": "Stakeholder Engagement Support",
+        "description": "Support Client engagement with key program stakeholders",
+        "category": "Business Operations Development (2)",
+        "priority": TaskPriority.MEDIUM,
+        "estimated_hours": 32,
+        "subtasks": ("Map key stakeholders", "Develop engagement strategy", "Prepare stakeholder communications", "Facilitate stakeholder meetings", "Maintain stakeholder relationships")
+    },
+    # Financial Excellence tasks (9 tasks)
+    {
+        "id": "FE001",
+        "title": "Interim CFO Function",
+        "description": "Serve in an interim 'CFO' function for Client",
+        "category": "Financial Excellence (2)",
+        "priority": TaskPriority.HIGH,
+        "estimated_hours": 120,
+        "subtasks": ("Establish CFO operational framework", "Implement financial controls", "Oversee cash flow management", "Provide strategic financial guidance", "Report to board/leadership")
+    },
+    {
+        "id": "FE002",
+        "title": "Financial Data Integration",
+        "description": "Collect, integrate and analyze financial inputs from each Client activity",
+        "category": "Financial Excellence (2)",
+        "priority": TaskPriority.HIGH,
+        "estimated_hours": 48,
+        "subtasks": ("Map all financial data sources", "Establish data collection processes", "Create integration workflows", "Develop analytical frameworks", "Generate integrated reports")
+    },
+    {
+        "id": "FE003",
+        "title": "Integrated Financial Model",
+        "description": "Build upon prior models to create integrated financial model for expansion program",
+        "category": "Financial Excellence (2)",
+        "priority": TaskPriority.HIGH,
+        "estimated_hours": 56,
+        "subtasks": ("Review existing financial models", "Design integrated model architecture", "Build expansion scenario models", "Validate model assumptions", "Document model methodology")
+    },
+    {
+        "id": "FE004",
+        "title": "Scenario & Sensitivity Analysis",
+        "description": "Conduct scenario and sensitivity analyses",
+        "category": "Financial Excellence (2)",
+        "priority": TaskPriority.HIGH,
+        "estimated_hours": 40,
+        "subtasks": ("Define scenario parameters", "Build sensitivity analysis framework", "Run multiple scenario models", "Analyze results and implications", "Present findings to leadership")
+    },
+    {
+        "id": "FE005",
+        "title": "Program Risk Identification",
+        "description": "Use financial information to identify key program risks at scale",
+        "category": "Financial Excellence (2)",
+        "priority": TaskPriority.HIGH,
+        "estimated_hours": 32,
+        "subtasks": ("Analyze financial risk indicators", "Identify scaling risk factors", "Quantify potential risk impact", "Develop risk mitigation strategies", "Create risk monitoring dashboard")
+    },
+    {
+        "id": "FE006",
+        "title": "Employee Retention Incentives",
+        "description": "Work with Client HR lead to incentivize long-term employee retention and platform expansion",
+        "category": "Financial Excellence (2)",
+        "priority": TaskPriority.MEDIUM,
+        "estimated_hours": 24,
+        "subtasks": ("Analyze current retention metrics", "Design retention incentive programs", "Model financial impact of retention", "Collaborate with HR on implementation", "Monitor program effectiveness")
+    },
+    {
+        "id": "FE007",
+        "title": "Financial Guidance & Decision Support",
+        "description": "Provide financial guidance to other Client employees and decisions",
+        "category": "Financial Excellence (2)",
+        "priority": TaskPriority.MEDIUM,
+        "estimated_hours": 36,
+        "subtasks": ("Establish financial advisory framework", "Create decision support tools", "Provide ongoing financial coaching", "Review major financial decisions", "Document guidance processes")
+    },
+    {
+        "id": "FE008",
+        "title": "Formal FP&A Function",
+        "description": "Implement formal FP&A function",
+        "category": "Financial Excellence (2)",
+        "priority": TaskPriority.MEDIUM,
+        "estimated_hours": 44,
+        "subtasks": ("Design FP&A organizational structure", "Implement planning processes", "Establish budgeting and forecasting", "Create performance analytics", "Train staff on FP&A processes")
+    },
+    {
+        "id": "FE009",
+        "title": "External Stakeholder Support",
+        "description": "Support financial inquiries from external Client stakeholders",
+        "category": "Financial Excellence (2)",
+        "priority": TaskPriority.LOW,
+        "estimated_hours": 20,
+        "subtasks": ("Identify external stakeholders", "Prepare stakeholder information packages", "Respond to financial inquiries", "Maintain stakeholder relationships", "Document all interactions")
+    },
+    # CEO and Client Leadership Support tasks (3 tasks)
+    {
+        "id": "CL001",
+        "title": "Ad Hoc Issue Support",
+        "description": "Provide ad hoc support to emergent issues",
+        "category": "CEO and Client Leadership Support (1)",
+        "priority": TaskPriority.HIGH,
+        "estimated_hours": 40,
+        "subtasks": ("Establish issue escalation process", "Create rapid response framework", "Maintain issue tracking system", "Provide timely issue resolution", "Document lessons learned")
+    },
+    {
+        "id": "CL002",
+        "title": "Presentation & Meeting Materials",
+        "description": "Prepare presentation and meeting materials for Client leadership",
+        "category": "CEO and Client Leadership Support (1)",
+        "priority": TaskPriority.MEDIUM,
+        "estimated_hours": 32,
+        "subtasks": ("Create presentation templates", "Develop executive dashboard content", "Prepare board meeting materials", "Design stakeholder presentations", "Maintain materials library")
+    },
+    {
+        "id": "CL003",
+        "title": "Direct Meeting Support",
+        "description": "Provide direct meeting support to Client leadership",
+        "category": "CEO and Client Leadership Support (1)",
+        "priority": TaskPriority.MEDIUM,
+        "estimated_hours": 48,
+        "subtasks": ("Attend leadership meetings", "Provide real-time analytical support", "Take meeting notes and actions", "Follow up on meeting outcomes", "Coordinate meeting logistics")
+    }
+)
+
+def _pg_array_literal(values) -> str:
+    """Format strings as a PostgreSQL text[] literal for COPY input"""
+    quoted = ('"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"' for value in values)
+    return '{' + ','.join(quoted) + '}'
+
+# Task ID prefix for each category; tasks in other categories use "XX"
+_CATEGORY_PREFIXES = MappingProxyType({
+    "Business Operations Development (2)": "BO",
+    "Financial Excellence (2)": "FE",
+    "CEO and Client Leadership Support (1)": "CL"
+})
+
+# Column codes for the known categories; unknown ones are appended as seen
+_CATEGORY_CODES = MappingProxyType({name: code for code, name in enumerate(_CATEGORY_PREFIXES)})
+
+# Default project timeline: weekly from the start date, last week cut off at the end date
+_TIMELINE_START = datetime(2025, 9, 1)
+_TIMELINE_END = datetime(2025, 12, 12)
+
+def _default_timeline_weeks():
+    """Get (week number, start, end, month label) for every default timeline week"""
+    starts = pd.date_range(_TIMELINE_START, _TIMELINE_END, freq='7D')
+    ends = starts + pd.Timedelta(days=6)
+    ends = ends.where(ends <= _TIMELINE_END, _TIMELINE_END)
+    return list(zip(
+        range(1, len(starts) + 1),
+        starts.to_pydatetime(),
+        ends.to_pydatetime(),
+        starts.strftime("%B %Y")
+    ))
+
+# Columns of the in-memory timeline frame
+_TIMELINE_COLUMNS = ['week_number', 'start_date', 'end_date', 'month', 'tasks']
+
+def _timeline_frame(rows=()) -> pd.DataFrame:
+    """Build a timeline frame from (week number, start, end, month, tasks) rows"""
+    # Object columns keep the Python dates/datetimes as given instead of
+    # coercing them to Timestamps, so get_timeline_data returns the same
+    # types for both backends
+    return pd.DataFrame(list(rows), columns=_TIMELINE_COLUMNS, dtype=object).astype({'week_number': 'int64'})
+
+@functools.lru_cache(maxsize=1)
+def _default_task_objects() -> Dict[str, Task]:
+    """Build the default Task objects once, as templates keyed by task ID"""
+    return {
+        task_data["id"]: Task(
+            id=task_data["id"],
+            title=task_data["title"],
+            description=task_data["description"],
+            category=task_data["category"],
+            priority=task_data["priority"],
+            status=TaskStatus.NOT_STARTED,
+            estimated_hours=task_data["estimated_hours"],
+            subtasks=list(task_data["subtasks"])
+        )
+        for task_data in _DEFAULT_TASKS_DATA
+    }
+
+# Set once this process has applied SCHEMA_DDL, so later managers skip it
+_SCHEMA_INITIALIZED = False
+
+# Schema DDL, sent to the server as one batch inside one transaction
+SCHEMA_DDL = (
+    # Create categories table
+    """
+    CREATE TABLE IF NOT EXISTS categories (
+        id SERIAL PRIMARY KEY,
+        name VARCHAR(255) UNIQUE NOT NULL,
+        description TEXT,
+        team_size INTEGER DEFAULT 1,
+        total_estimated_hours INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+
+    # Create tasks table
+    """
+    CREATE TABLE IF NOT EXISTS tasks (
+        id VARCHAR(50) PRIMARY KEY,
+        title VARCHAR(500) NOT NULL,
+        description TEXT,
+        category VARCHAR(255) REFERENCES categories(name),
+        priority VARCHAR(20) DEFAULT 'Medium',
+        status VARCHAR(20) DEFAULT 'Not Started',
+        start_date DATE,
+        end_date DATE,
+        estimated_hours INTEGER,
+        actual_hours INTEGER,
+        dependencies TEXT[], -- Array of task IDs
+        assigned_to VARCHAR(255),
+        completion_percentage FLOAT DEFAULT 0.0,
+        notes TEXT,
+        subtasks TEXT[], -- Array of subtask descriptions
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+
+    # Indexes for the dashboard filters; the category/status index also
+    # covers the progress rollup columns for index-only scans
+    """
+    CREATE INDEX IF NOT EXISTS idx_tasks_csp ON tasks (category, status, priority)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_tasks_category_status ON tasks (category, status)
+    INCLUDE (completion_percentage, estimated_hours)
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority)",
+
+    # Unlogged staging table for bulk-loading tasks with COPY
+    "CREATE UNLOGGED TABLE IF NOT EXISTS tasks_stage (LIKE tasks INCLUDING DEFAULTS)",
+
+    # Create timeline weeks table
+    """
+    CREATE TABLE IF NOT EXISTS timeline_weeks (
+        id SERIAL PRIMARY KEY,
+        week_number INTEGER NOT NULL,
+        start_date DATE NOT NULL,
+        end_date DATE NOT NULL,
+        month VARCHAR(50),
+        assigned_tasks TEXT[], -- Array of task IDs
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_tw_weeknum ON timeline_weeks (week_number)",
+
+    # Stamp every task INSERT and UPDATE on the server, so all stamps come
+    # from the database clock and readers can detect external writes
+    """
+    CREATE OR REPLACE FUNCTION touch_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at = CURRENT_TIMESTAMP;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS tasks_touch_updated_at ON tasks",
+    """
+    CREATE TRIGGER tasks_touch_updated_at
+    BEFORE INSERT OR UPDATE ON tasks
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at()
+    """,
+
+    # Per-category progress rollup, kept current by a statement-level trigger
+    # that only fires for writes touching the columns it aggregates
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS category_progress AS
+    SELECT category,
+           COUNT(*) AS task_count,
+           COUNT(*) FILTER (WHERE status = 'Completed') AS completed_tasks,
+           COUNT(*) FILTER (WHERE status = 'In Progress') AS in_progress_tasks,
+           COALESCE(SUM(estimated_hours), 0) AS estimated_hours,
+           COALESCE(SUM(actual_hours), 0) AS actual_hours,
+           COALESCE(SUM(completion_percentage), 0) AS total_progress
+    FROM tasks
+    GROUP BY category
+    """,
+    # Unique index so the view can be refreshed CONCURRENTLY; GROUP BY
+    # category yields at most one NULL row, which a unique index permits
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_category_progress_category_unique
+    ON category_progress (category)
+    """,
+    """
+    CREATE OR REPLACE FUNCTION refresh_category_progress() RETURNS trigger AS $$
+    BEGIN
+        -- CONCURRENTLY leaves the view readable while it is rebuilt
+        REFRESH MATERIALIZED VIEW CONCURRENTLY category_progress;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS tasks_refresh_category_progress ON tasks",
+    """
+    CREATE TRIGGER tasks_refresh_category_progress
+    AFTER INSERT OR DELETE
+       OR UPDATE OF category, status, completion_percentage, estimated_hours, actual_hours
+    ON tasks
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_category_progress()
+    """,
+)
+
+# Data versions are drawn from one process-wide sequence, so a rebuilt manager
+# never reuses a version an earlier instance had cached aggregates under
+_DATA_VERSIONS = itertools.count(1)
+
+# Integer code for each status, in enum order
+_STATUS_CODES = {status: code for code, status in enumerate(TaskStatus)}
+_COMPLETED_CODE = _STATUS_CODES[TaskStatus.COMPLETED]
+_IN_PROGRESS_CODE = _STATUS_CODES[TaskStatus.IN_PROGRESS]
+
+# Project summary totals when there are no tasks at all
+_EMPTY_SUMMARY = {
+    "total_tasks": 0,
+    "completed_tasks": 0,
+    "in_progress_tasks": 0,
+    "not_started_tasks": 0,
+    "overall_completion": 0,
+    "overall_progress": 0,
+    "total_estimated_hours": 0,
+    "total_actual_hours": 0,
+    "hours_variance": 0
+}
+
+# Per-category summary entry for a category without tasks
+_EMPTY_CATEGORY_SUMMARY = {
+    "completion_percentage": 0.0,
+    "average_progress": 0.0,
+    "estimated_hours": 0,
+    "actual_hours": 0,
+    "hours_variance": 0
+}
+
+def _reduce_categories(status, progress, estimated_hours, actual_hours, category,
+                       n_categories, completed_code, in_progress_code):
+    """Fused single-pass reduction of the task columns into per-category
+    counts and sums. Compiled with Numba when it is installed."""
+    counts = np.zeros(n_categories, np.int64)
+    completed = np.zeros(n_categories, np.int64)
+    in_progress = np.zeros(n_categories, np.int64)
+    estimated = np.zeros(n_categories, np.int64)
+    actual = np.zeros(n_categories, np.int64)
+    progress_sum = np.zeros(n_categories, np.float64)
+    for i in range(status.shape[0]):
+        c = category[i]
+        counts[c] += 1
+        if status[i] == completed_code:
+            completed[c] += 1
+        elif status[i] == in_progress_code:
+            in_progress[c] += 1
+        estimated[c] += estimated_hours[i]
+        actual[c] += actual_hours[i]
+        progress_sum[c] += progress[i]
+    return counts, completed, in_progress, estimated, actual, progress_sum
+
+if njit is not None:
+    _reduce_categories = njit(cache=True, boundscheck=False)(_reduce_categories)
+
+class _TaskColumns:
+    """Struct-of-arrays copy of the numeric task fields, so progress
+    reductions run in NumPy instead of looping over Task objects"""
+    
+    _ARRAYS = ('estimated_hours', 'actual_hours', 'progress', 'status', 'category')
+    
+    def __init__(self, capacity: int = 64):
+        self.n = 0
+        self.rows = {}  # Task ID -> row
+        self.category_codes = dict(_CATEGORY_CODES)  # Category name -> code
+        self.estimated_hours = np.zeros(capacity, dtype=np.int64)
+        self.actual_hours = np.zeros(capacity, dtype=np.int64)
+        self.progress = np.zeros(capacity, dtype=np.float64)
+        self.status = np.zeros(capacity, dtype=np.int8)
+        self.category = np.zeros(capacity, dtype=np.int16)
+    
+    def _grow(self):
+        """Double the capacity of every column"""
+        capacity = len(self.progress) * 2
+        for name in self._ARRAYS:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.n] = column[:self.n]
+            setattr(self, name, grown)
+    
+    def upsert(self, task: Task):
+        """Write a task's current field values into its row, adding one if new"""
+        row = self.rows.get(task.id)
+        if row is None:
+            if self.n == len(self.progress):
+                self._grow()
+            row = self.rows[task.id] = self.n
+            self.n += 1
+        self.estimated_hours[row] = task.estimated_hours or 0
+        self.actual_hours[row] = task.actual_hours or 0
+        self.progress[row] = task.completion_percentage or 0.0
+        self.status[row] = _STATUS_CODES[task.status]
+        self.category[row] = self.category_codes.setdefault(task.category, len(self.category_codes))
+    
+    def category_totals(self) -> Dict[str, Dict[str, float]]:
+        """Per-category task totals, from the fused Numba kernel when available
+        and otherwise bucketed with np.bincount in one pass per column"""
+        n, k = self.n, len(self.category_codes)
+        category = self.category[:n]
+        status = self.status[:n]
+        
+        if njit is not None:
+            counts, completed, in_progress, estimated_hours, actual_hours, progress = _reduce_categories(
+                status, self.progress[:n], self.estimated_hours[:n], self.actual_hours[:n],
+                category, k, _COMPLETED_CODE, _IN_PROGRESS_CODE
+            )
+        else:
+            counts = np.bincount(category, minlength=k)
+            completed = np.bincount(category[status == _COMPLETED_CODE], minlength=k)
+            in_progress = np.bincount(category[status == _IN_PROGRESS_CODE], minlength=k)
+            estimated_hours = np.bincount(category, weights=self.estimated_hours[:n], minlength=k)
+            actual_hours = np.bincount(category, weights=self.actual_hours[:n], minlength=k)
+            progress = np.bincount(category, weights=self.progress[:n], minlength=k)
+        
+        return {
+            name: {
+                'tasks': int(counts[code]),
+                'completed': int(completed[code]),
+                'in_progress': int(in_progress[code]),
+                'estimated_hours': int(estimated_hours[code]),
+                'actual_hours': int(actual_hours[code]),
+                'progress': float(progress[code])
+            }
+            for name, code in self.category_codes.items()
+        }
+    
+    def totals_for(self, category_name: str) -> Optional[Dict[str, float]]:
+        """Task totals for one category, or None if it has no tasks"""
+        code = self.category_codes.get(category_name)
+        if code is None:
+            return None
+        mask = self.category[:self.n] == code
+        count = int(np.count_nonzero(mask))
+        if not count:
+            return None
+        return {
+            'tasks': count,
+            'completed': int(np.count_nonzero(self.status[:self.n][mask] == _COMPLETED_CODE)),
+            'estimated_hours': int(self.estimated_hours[:self.n][mask].sum()),
+            'actual_hours': int(self.actual_hours[:self.n][mask].sum()),
+            'progress': float(self.progress[:self.n][mask].sum())
+        }
+
+# Hot per-task writes, prepared once per pooled connection on first use.
+# Each UPDATE returns the updated row so the in-memory task can be refreshed without a re-read.
+# updated_at is stamped by the tasks_touch_updated_at trigger, so it isn't a parameter.
+PREPARED_STATEMENTS = {
+    'update_task_title': """
+        PREPARE update_task_title (text, text) AS
+        UPDATE tasks SET title = $1 WHERE id = $2 RETURNING *
+    """,
+    'update_task_description': """
+        PREPARE update_task_description (text, text) AS
+        UPDATE tasks SET description = $1 WHERE id = $2 RETURNING *
+    """,
+    'update_task_status': """
+        PREPARE update_task_status (text, float8, text) AS
+        UPDATE tasks SET status = $1, completion_percentage = $2 WHERE id = $3 RETURNING *
+    """,
+    'update_task_actual_hours': """
+        PREPARE update_task_actual_hours (integer, text) AS
+        UPDATE tasks SET actual_hours = $1 WHERE id = $2 RETURNING *
+    """,
+    'update_task_bulk': """
+        PREPARE update_task_bulk (text, float8, integer, text) AS
+        UPDATE tasks SET status = $1, completion_percentage = $2, actual_hours = $3
+        WHERE id = $4 RETURNING *
+    """
+}
+
+class PreparedConnection(psycopg2.extensions.connection):
+    """Connection that remembers which statements it has already prepared"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+@functools.lru_cache(maxsize=1)
+def _resolve_db_url() -> str:
+    """Resolve the database URL once per process"""
+    # Try Streamlit secrets first (for cloud deployment). A missing secrets file
+    # raises StreamlitSecretNotFoundError, a FileNotFoundError subclass
+    try:
+        return st.secrets['database']['url']
+    except (KeyError, FileNotFoundError):
+        pass
+    
+    # Try environment variable
+    db_url = os.getenv('DATABASE_URL')
+    if db_url:
+        return db_url
+        
+    # Fallback to local PostgreSQL for development
+    return "postgresql://localhost:5432/workplan_db"
+
+@st.cache_resource
+def _connection_pool(db_url: str) -> ThreadedConnectionPool:
+    """Create one process-wide PostgreSQL connection pool per database URL"""
+    return ThreadedConnectionPool(
+        2, 10,
+        dsn=db_url,
+        connection_factory=PreparedConnection,
+        cursor_factory=RealDictCursor,
+        application_name='srs_dashboard'
+    )
+
+# Multi-row task upsert, for execute_values. The tasks_touch_updated_at
+# trigger stamps updated_at, so it is neither inserted nor in the SET list
+SAVE_TASKS_SQL = """
+    INSERT INTO tasks (
+        id, title, description, category, priority, status,
+        start_date, end_date, estimated_hours, actual_hours,
+        dependencies, assigned_to, completion_percentage, notes,
+        subtasks
+    ) VALUES %s
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        description = EXCLUDED.description,
+        priority = EXCLUDED.priority,
+        status = EXCLUDED.status,
+        start_date = EXCLUDED.start_date,
+        end_date = EXCLUDED.end_date,
+        estimated_hours = EXCLUDED.estimated_hours,
+        actual_hours = EXCLUDED.actual_hours,
+        dependencies = EXCLUDED.dependencies,
+        assigned_to = EXCLUDED.assigned_to,
+        completion_percentage = EXCLUDED.completion_percentage,
+        notes = EXCLUDED.notes,
+        subtasks = EXCLUDED.subtasks
+    RETURNING id, updated_at
+"""
 
 class DatabaseManager:
     def __init__(self):
-        """Initialize database connection"""
-        self.connection = None
+        """Initialize database connection pool"""
+        self.pool = None
         self.connect()
     
     def get_db_url(self):
         """Get database URL from environment or Streamlit secrets"""
-        # Try Streamlit secrets first (for cloud deployment)
-        try:
-            if hasattr(st, 'secrets') and 'database' in st.secrets:
-                return st.secrets['database']['url']
-        except:
-            pass
-        
-        # Try environment variable
-        db_url = os.getenv('DATABASE_URL')
-        if db_url:
-            return db_url
-            
-        # Fallback to local PostgreSQL for development
-        return "postgresql://localhost:5432/workplan_db"
+        return _resolve_db_url()
     
     def connect(self):
-        """Connect to PostgreSQL database"""
+        """Attach to the shared PostgreSQL connection pool"""
         try:
-            db_url = self.get_db_url()
-            self.connection = psycopg2.connect(db_url, cursor_factory=RealDictCursor)
-            self.connection.autocommit = True
+            self.pool = _connection_pool(self.get_db_url())
             self.init_database()
         except Exception as e:
             print(f"Database connection error: {e}")
             # For development/demo, we'll use a fallback
-            self.connection = None
+            self.pool = None
+    
+    @contextmanager
+    def get_conn(self):
+        """Borrow a pooled connection for the duration of a with-block"""
+        conn = self.pool.getconn()
+        try:
+            conn.autocommit = True
+            yield conn
+        finally:
+            self.pool.putconn(conn, close=bool(conn.closed))
+    
+    def query_scalar(self, query: str, params: Tuple = None):
+        """Run a query and return the first column of its first row"""
+        with self.get_conn() as conn, conn.cursor() as cursor:
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+            return next(iter(row.values())) if row else None
+    
+    def execute_prepared(self, name: str, params: Tuple):
+        """Execute a prepared statement, preparing it on this connection if needed.
+        Returns the first result row, if the statement produces one."""
+        with self.get_conn() as conn, conn.cursor() as cursor:
+            # Prepared lazily rather than at connect time: the pool opens its
+            # first connections before init_database has created the tables
+            if name not in conn.prepared:
+                cursor.execute(PREPARED_STATEMENTS[name])
+                conn.prepared.add(name)
+            cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+            return cursor.fetchone() if cursor.description else None
     
     def init_database(self):
         """Initialize database tables"""
-        if not self.connection:
+        global _SCHEMA_INITIALIZED
+        if not self.pool or _SCHEMA_INITIALIZED:
             return
             
-        cursor = self.connection.cursor()
-        
-        # Create categories table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS categories (
-                id SERIAL PRIMARY KEY,
-                name VARCHAR(255) UNIQUE NOT NULL,
-                description TEXT,
-                team_size INTEGER DEFAULT 1,
-                total_estimated_hours INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create tasks table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tasks (
-                id VARCHAR(50) PRIMARY KEY,
-                title VARCHAR(500) NOT NULL,
-                description TEXT,
-                category VARCHAR(255) REFERENCES categories(name),
-                priority VARCHAR(20) DEFAULT 'Medium',
-                status VARCHAR(20) DEFAULT 'Not Started',
-                start_date DATE,
-                end_date DATE,
-                estimated_hours INTEGER,
-                actual_hours INTEGER,
-                dependencies TEXT[], -- Array of task IDs
-                assigned_to VARCHAR(255),
-                completion_percentage FLOAT DEFAULT 0.0,
-                notes TEXT,
-                subtasks TEXT[], -- Array of subtask descriptions
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create timeline weeks table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS timeline_weeks (
-                id SERIAL PRIMARY KEY,
-                week_number INTEGER NOT NULL,
-                start_date DATE NOT NULL,
-                end_date DATE NOT NULL,
-                month VARCHAR(50),
-                assigned_tasks TEXT[], -- Array of task IDs
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        cursor.close()
+        with self.get_conn() as conn, conn.cursor() as cursor:
+            # One round-trip and one commit for the whole schema. The transaction-level
+            # advisory lock keeps concurrent workers from running the DDL at the same time
+            conn.autocommit = False
+            try:
+                cursor.execute("SELECT pg_advisory_xact_lock(hashtext('workplan_schema'))")
+                cursor.execute(";\n".join(SCHEMA_DDL))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.autocommit = True
+        _SCHEMA_INITIALIZED = True
         print("Database initialized successfully")
 
 class WorkplanDatabaseManager:
@@ -155,12 +775,33 @@ class WorkplanDatabaseManager:
         self.db = DatabaseManager()
         self.categories = {}
         self.tasks = {}
-        self.timeline_weeks = []
+        self._timeline_df = _timeline_frame()
+        self.data_version = next(_DATA_VERSIONS)  # Advanced on every write so cached aggregates can be invalidated
+        self._write_lock = threading.RLock()  # Serializes writes from concurrent sessions; reads stay lock-free
+        self._loaded_at = None  # Newest tasks.updated_at fetched from the database, for detecting external writes
+        self._own_writes = {}  # Task ID -> updated_at of the row this manager last wrote itself
+        self._loaded = False
+        # Inverted indexes from status/priority to task IDs, kept in step with self.tasks
+        self._by_status = defaultdict(set)
+        self._by_priority = defaultdict(set)
+        self._category_counters = {}  # Highest task number in use per ID prefix
+        self._columns = _TaskColumns()
+        # Summary memos, valid while data_version is unchanged
+        self._summary_cache_version = None
+        self._summary_cache = None
+        self._category_progress_cache_version = None
+        self._category_progress_cache = {}
+        self._category_tasks_cache_version = None
+        self._category_tasks_cache = {}
         self.initialize_data()
         
     def initialize_data(self):
         """Initialize data from database or create default data"""
-        if not self.db.connection:
+        if self._loaded:
+            return
+        self._loaded = True
+        
+        if not self.db.pool:
             # Fallback to in-memory data for demo
             self._create_default_data()
             return
@@ -173,345 +814,258 @@ class WorkplanDatabaseManager:
             print(f"Error loading from database: {e}")
             self._create_default_data()
     
+    def reload(self):
+        """Discard the in-memory data and load it again"""
+        with self._write_lock:
+            self.categories = {}
+            self.tasks = {}
+            self._timeline_df = _timeline_frame()
+            self._by_status.clear()
+            self._by_priority.clear()
+            self._category_counters.clear()
+            self._columns = _TaskColumns()
+            self._own_writes.clear()
+            self._loaded = False
+            self.initialize_data()
+            self.data_version = next(_DATA_VERSIONS)
+    
     def _load_from_database(self):
         """Load all data from database"""
-        if not self.db.connection:
+        if not self.db.pool:
             return
             
-        cursor = self.db.connection.cursor()
+        with self.db.get_conn() as conn:
+            # Rows are streamed in batches through server-side cursors, which
+            # only live inside a transaction
+            conn.autocommit = False
+            
+            # Load categories and their tasks in one joined query
+            with conn.cursor(name='load_stream') as load_cursor:
+                load_cursor.itersize = 500
+                load_cursor.execute("""
+                    SELECT t.*,
+                           c.name AS cat_name,
+                           c.description AS cat_description,
+                           c.team_size AS cat_team_size,
+                           c.total_estimated_hours AS cat_total_estimated_hours
+                    FROM categories c
+                    FULL JOIN tasks t ON t.category = c.name
+                    ORDER BY c.name, t.id
+                """)
+                for row in load_cursor:
+                    # Categories arrive on their first row, tasks or not
+                    category_name = row['cat_name']
+                    if category_name is not None and category_name not in self.categories:
+                        self.categories[category_name] = {
+                            'description': row['cat_description'],
+                            'team_size': row['cat_team_size'],
+                            'total_estimated_hours': row['cat_total_estimated_hours'],
+                            'tasks': []
+                        }
+                    
+                    if row['id'] is None:
+                        continue  # Category without tasks
+                    
+                    task = Task._from_row(row)
+                    self.tasks[task.id] = task
+                    self._index_task(task)
+                    
+                    # Add to category tasks
+                    if task.category in self.categories:
+                        self.categories[task.category]['tasks'].append(task)
+            
+            # Load timeline weeks
+            with conn.cursor(name='timeline_stream') as timeline_cursor:
+                timeline_cursor.itersize = 500
+                timeline_cursor.execute("SELECT * FROM timeline_weeks ORDER BY week_number")
+                self._timeline_df = _timeline_frame(
+                    (row['week_number'], row['start_date'], row['end_date'],
+                     row['month'], row['assigned_tasks'] or [])
+                    for row in timeline_cursor
+                )
+            
+            conn.commit()
+            conn.autocommit = True
         
-        # Load categories
-        cursor.execute("SELECT * FROM categories ORDER BY name")
-        for row in cursor.fetchall():
-            self.categories[row['name']] = {
-                'description': row['description'],
-                'team_size': row['team_size'],
-                'total_estimated_hours': row['total_estimated_hours'],
-                'tasks': []
-            }
+        self._loaded_at = max(
+            (task.updated_at for task in self.tasks.values() if task.updated_at), default=None
+        )
+    
+    def _index_task(self, task: Task):
+        """Add a task to the status and priority indexes, numeric columns and ID counters"""
+        self._by_status[task.status].add(task.id)
+        self._by_priority[task.priority].add(task.id)
         
-        # Load tasks
-        cursor.execute("SELECT * FROM tasks ORDER BY id")
-        for row in cursor.fetchall():
-            task = Task(
-                id=row['id'],
-                title=row['title'],
-                description=row['description'] or '',
-                category=row['category'],
-                priority=TaskPriority(row['priority']),
-                status=TaskStatus(row['status']),
-                start_date=row['start_date'],
-                end_date=row['end_date'],
-                estimated_hours=row['estimated_hours'],
-                actual_hours=row['actual_hours'],
-                dependencies=row['dependencies'] or [],
-                assigned_to=row['assigned_to'],
-                completion_percentage=row['completion_percentage'],
-                notes=row['notes'] or '',
-                subtasks=row['subtasks'] or [],
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
-            self.tasks[task.id] = task
-            
-            # Add to category tasks
-            if task.category in self.categories:
-                task_dict = {
-                    'id': task.id,
-                    'title': task.title,
-                    'description': task.description,
-                    'priority': task.priority,
-                    'estimated_hours': task.estimated_hours,
-                    'subtasks': task.subtasks
-                }
-                self.categories[task.category]['tasks'].append(task_dict)
+        self._columns.upsert(task)
+        
+        prefix, number = task.id[:2], task.id[2:]
+        if number.isdigit() and int(number) > self._category_counters.get(prefix, 0):
+            self._category_counters[prefix] = int(number)
+    
+    def _unindex_task(self, task: Task):
+        """Remove a task from the status and priority indexes"""
+        self._by_status[task.status].discard(task.id)
+        self._by_priority[task.priority].discard(task.id)
+    
+    def _store_task(self, task: Task):
+        """Put a task into the in-memory mirror, replacing any earlier copy"""
+        previous = self.tasks.get(task.id)
+        self.tasks[task.id] = task
+        if previous is not None:
+            self._unindex_task(previous)
+        self._index_task(task)
         
-        # Load timeline weeks
-        cursor.execute("SELECT * FROM timeline_weeks ORDER BY week_number")
-        for row in cursor.fetchall():
-            self.timeline_weeks.append({
-                'week_number': row['week_number'],
-                'start_date': row['start_date'],
-                'end_date': row['end_date'],
-                'month': row['month'],
-                'tasks': row['assigned_tasks'] or []
-            })
+        if previous is not None and previous.category in self.categories:
+            category_tasks = self.categories[previous.category]['tasks']
+            for i, existing in enumerate(category_tasks):
+                if existing.id == task.id:
+                    if previous.category == task.category:
+                        category_tasks[i] = task  # Keep its place in the list
+                        return
+                    del category_tasks[i]
+                    break
+        if task.category in self.categories:
+            self.categories[task.category]['tasks'].append(task)
+    
+    def refresh_if_stale(self) -> bool:
+        """Pull in tasks written by other processes since the last load.
+        Returns False if the database can no longer be reached."""
+        if not self.db.pool:
+            return True
         
-        cursor.close()
+        try:
+            latest = self.db.query_scalar("SELECT max(updated_at) FROM tasks")
+            if latest and (self._loaded_at is None or latest > self._loaded_at):
+                self.reload_incremental(since=self._loaded_at)
+        except psycopg2.Error as e:
+            print(f"Error checking for task changes: {e}")
+            return False
+        return True
+    
+    def reload_incremental(self, since: datetime = None) -> int:
+        """Re-read tasks updated after the given time into memory, returning how many changed"""
+        with self._write_lock:
+            with self.db.get_conn() as conn, conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT * FROM tasks WHERE %s IS NULL OR updated_at > %s ORDER BY id",
+                    (since, since)
+                )
+                rows = cursor.fetchall()
+            
+            # Rows we wrote ourselves are already in memory; anything else is external
+            changed = [row for row in rows if self._own_writes.get(row['id']) != row['updated_at']]
+            for row in changed:
+                self._store_task(Task._from_row(row))
+            
+            # The watermark only moves past rows actually fetched, so an external
+            # write stamped before one of ours is still picked up
+            if rows:
+                latest = max(row['updated_at'] for row in rows)
+                if self._loaded_at is None or latest > self._loaded_at:
+                    self._loaded_at = latest
+                self._own_writes = {
+                    task_id: stamp for task_id, stamp in self._own_writes.items()
+                    if stamp > self._loaded_at
+                }
+            
+            if changed:
+                self.data_version = next(_DATA_VERSIONS)
+            return len(changed)
     
     def _populate_default_data(self):
         """Populate database with default workplan data"""
-        if not self.db.connection:
+        if not self.db.pool:
             return
-            
-        cursor = self.db.connection.cursor()
         
-        # Insert categories
-        categories_data = [
-            ("Business Operations Development (2)", "Comprehensive business operations development and scaling support", 2, 332),
-            ("Financial Excellence (2)", "Financial leadership, modeling, and FP&A implementation", 2, 420),
-            ("CEO and Client Leadership Support (1)", "Executive support and leadership meeting facilitation", 1, 120)
-        ]
+        # Seed only an empty database; one probe instead of per-row conflict checks
+        if self.db.query_scalar("SELECT EXISTS (SELECT 1 FROM tasks)"):
+            return
         
-        for name, desc, team_size, hours in categories_data:
-            cursor.execute("""
+        with self.db.get_conn() as conn, conn.cursor() as cursor:
+            # Insert categories
+            categories_data = [
+                ("Business Operations Development (2)", "Comprehensive business operations development and scaling support", 2, 332),
+                ("Financial Excellence (2)", "Financial leadership, modeling, and FP&A implementation", 2, 420),
+                ("CEO and Client Leadership Support (1)", "Executive support and leadership meeting facilitation", 1, 120)
+            ]
+            
+            execute_values(cursor, """
                 INSERT INTO categories (name, description, team_size, total_estimated_hours)
-                VALUES (%s, %s, %s, %s)
+                VALUES %s
                 ON CONFLICT (name) DO NOTHING
-            """, (name, desc, team_size, hours))
-        
-        # Insert tasks with comprehensive data
-        tasks_data = self._get_default_tasks_data()
-        
-        for task_data in tasks_data:
-            cursor.execute("""
-                INSERT INTO tasks (
-                    id, title, description, category, priority, estimated_hours, subtasks
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (id) DO NOTHING
-            """, (
-                task_data['id'],
-                task_data['title'],
-                task_data['description'],
-                task_data['category'],
-                task_data['priority'].value,
-                task_data['estimated_hours'],
-                task_data['subtasks']
-            ))
+            """, categories_data)
+            
+            # Insert tasks with comprehensive data: COPY them into the unlogged
+            # staging table, then move them across in one INSERT ... SELECT
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for task_data in _DEFAULT_TASKS_DATA:
+                writer.writerow((
+                    task_data['id'],
+                    task_data['title'],
+                    task_data['description'],
+                    task_data['category'],
+                    task_data['priority'].value,
+                    task_data['estimated_hours'],
+                    _pg_array_literal(task_data['subtasks'])
+                ))
+            buffer.seek(0)
+            
+            conn.autocommit = False
+            try:
+                cursor.copy_expert("""
+                    COPY tasks_stage (
+                        id, title, description, category, priority, estimated_hours, subtasks
+                    ) FROM STDIN WITH (FORMAT csv)
+                """, buffer)
+                cursor.execute("""
+                    INSERT INTO tasks SELECT * FROM tasks_stage
+                    ON CONFLICT (id) DO NOTHING
+                """)
+                cursor.execute("TRUNCATE tasks_stage")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.autocommit = True
         
         # Insert timeline weeks
         self._create_timeline_weeks()
         
-        cursor.close()
-        
-        # Reload data
-        self._load_from_database()
-    
-    def _get_default_tasks_data(self):
-        """Get default tasks data structure - all 20 tasks"""
-        return [
-            # Business Operations Development tasks (8 tasks)
-            {
-                "id": "BO001",
-                "title": "Business Requirements Assessment",
-                "description": "Assess and consolidate program needs and future state business requirements to operate at significantly higher scale",
-                "category": "Business Operations Development (2)",
-                "priority": TaskPriority.HIGH,
-                "estimated_hours": 40,
-                "subtasks": ["Conduct stakeholder interviews", "Document current state processes", "Identify scaling bottlenecks", "Define future state requirements", "Create requirements consolidation report"]
-            },
-            {
-                "id": "BO002", 
-                "title": "Future State Operating Model",
-                "description": "Build on prior assessments to finalize target future state business operating model and implementation plans for each business discipline",
-                "category": "Business Operations Development (2)",
-                "priority": TaskPriority.HIGH,
-                "estimated_hours": 60,
-                "subtasks": ["Review prior assessment findings", "Design target operating model", "Create discipline-specific implementation plans", "Define organizational structure", "Document process flows"]
-            },
-            {
-                "id": "BO003",
-                "title": "Business Discipline Maturity Framework",
-                "description": "Codify requisite business discipline maturity, with associated 'heatmap' to prioritize development",
-                "category": "Business Operations Development (2)",
-                "priority": TaskPriority.HIGH,
-                "estimated_hours": 32,
-                "subtasks": ["Define maturity levels for each discipline", "Assess current maturity state", "Create maturity heatmap", "Prioritize development areas", "Document maturity framework"]
-            },
-            {
-                "id": "BO004",
-                "title": "Implementation Plan Execution",
-                "description": "Support implementation plan execution, with initial emphasis on HR, technology, and contract compliance",
-                "category": "Business Operations Development (2)",
-                "priority": TaskPriority.HIGH,
-                "estimated_hours": 80,
-                "subtasks": ["Establish HR implementation workstream", "Launch technology upgrade initiatives", "Implement contract compliance framework", "Monitor implementation progress", "Provide ongoing execution support"]
-            },
-            {
-                "id": "BO005",
-                "title": "Progress Monitoring & Reporting",
-                "description": "Monitor, evaluate, and report implementation progress",
-                "category": "Business Operations Development (2)",
-                "priority": TaskPriority.MEDIUM,
-                "estimated_hours": 24,
-                "subtasks": ["Establish progress tracking metrics", "Create reporting templates", "Conduct weekly progress reviews", "Generate monthly progress reports", "Present findings to leadership"]
-            },
-            {
-                "id": "BO006",
-                "title": "Business Operations Rhythm",
-                "description": "Establish long-term business operations operating rhythm, to include governance, decision rights, and meeting/decision cadence",
-                "category": "Business Operations Development (2)",
-                "priority": TaskPriority.MEDIUM,
-                "estimated_hours": 36,
-                "subtasks": ["Design governance structure", "Define decision rights matrix", "Establish meeting cadences", "Create decision-making processes", "Document operating rhythm"]
-            },
-            {
-                "id": "BO007",
-                "title": "Risk & Opportunity Register",
-                "description": "Document and codify risk and opportunity register for regular Client leadership review",
-                "category": "Business Operations Development (2)",
-                "priority": TaskPriority.MEDIUM,
-                "estimated_hours": 28,
-                "subtasks": ["Identify program risks and opportunities", "Create risk assessment framework", "Establish opportunity evaluation process", "Document register format", "Schedule regular leadership reviews"]
-            },
-            {
-                "id": "BO008",
-                "title": "Stakeholder Engagement Support",
-                "description": "Support Client engagement with key program stakeholders",
-                "category": "Business Operations Development (2)",
-                "priority": TaskPriority.MEDIUM,
-                "estimated_hours": 32,
-                "subtasks": ["Map key stakeholders", "Develop engagement strategy", "Prepare stakeholder communications", "Facilitate stakeholder meetings", "Maintain stakeholder relationships"]
-            },
-            # Financial Excellence tasks (9 tasks)
-            {
-                "id": "FE001",
-                "title": "Interim CFO Function",
-                "description": "Serve in an interim 'CFO' function for Client",
-                "category": "Financial Excellence (2)",
-                "priority": TaskPriority.HIGH,
-                "estimated_hours": 120,
-                "subtasks": ["Establish CFO operational framework", "Implement financial controls", "Oversee cash flow management", "Provide strategic financial guidance", "Report to board/leadership"]
-            },
-            {
-                "id": "FE002",
-                "title": "Financial Data Integration",
-                "description": "Collect, integrate and analyze financial inputs from each Client activity",
-                "category": "Financial Excellence (2)",
-                "priority": TaskPriority.HIGH,
-                "estimated_hours": 48,
-                "subtasks": ["Map all financial data sources", "Establish data collection processes", "Create integration workflows", "Develop analytical frameworks", "Generate integrated reports"]
-            },
-            {
-                "id": "FE003",
-                "title": "Integrated Financial Model",
-                "description": "Build upon prior models to create integrated financial model for expansion program",
-                "category": "Financial Excellence (2)",
-                "priority": TaskPriority.HIGH,
-                "estimated_hours": 56,
-                "subtasks": ["Review existing financial models", "Design integrated model architecture", "Build expansion scenario models", "Validate model assumptions", "Document model methodology"]
-            },
-            {
-                "id": "FE004",
-                "title": "Scenario & Sensitivity Analysis",
-                "description": "Conduct scenario and sensitivity analyses",
-                "category": "Financial Excellence (2)",
-                "priority": TaskPriority.HIGH,
-                "estimated_hours": 40,
-                "subtasks": ["Define scenario parameters", "Build sensitivity analysis framework", "Run multiple scenario models", "Analyze results and implications", "Present findings to leadership"]
-            },
-            {
-                "id": "FE005",
-                "title": "Program Risk Identification",
-                "description": "Use financial information to identify key program risks at scale",
-                "category": "Financial Excellence (2)",
-                "priority": TaskPriority.HIGH,
-                "estimated_hours": 32,
-                "subtasks": ["Analyze financial risk indicators", "Identify scaling risk factors", "Quantify potential risk impact", "Develop risk mitigation strategies", "Create risk monitoring dashboard"]
-            },
-            {
-                "id": "FE006",
-                "title": "Employee Retention Incentives",
-                "description": "Work with Client HR lead to incentivize long-term employee retention and platform expansion",
-                "category": "Financial Excellence (2)",
-                "priority": TaskPriority.MEDIUM,
-                "estimated_hours": 24,
-                "subtasks": ["Analyze current retention metrics", "Design retention incentive programs", "Model financial impact of retention", "Collaborate with HR on implementation", "Monitor program effectiveness"]
-            },
-            {
-                "id": "FE007",
-                "title": "Financial Guidance & Decision Support",
-                "description": "Provide financial guidance to other Client employees and decisions",
-                "category": "Financial Excellence (2)",
-                "priority": TaskPriority.MEDIUM,
-                "estimated_hours": 36,
-                "subtasks": ["Establish financial advisory framework", "Create decision support tools", "Provide ongoing financial coaching", "Review major financial decisions", "Document guidance processes"]
-            },
-            {
-                "id": "FE008",
-                "title": "Formal FP&A Function",
-                "description": "Implement formal FP&A function",
-                "category": "Financial Excellence (2)",
-                "priority": TaskPriority.MEDIUM,
-                "estimated_hours": 44,
-                "subtasks": ["Design FP&A organizational structure", "Implement planning processes", "Establish budgeting and forecasting", "Create performance analytics", "Train staff on FP&A processes"]
-            },
-            {
-                "id": "FE009",
-                "title": "External Stakeholder Support",
-                "description": "Support financial inquiries from external Client stakeholders",
-                "category": "Financial Excellence (2)",
-                "priority": TaskPriority.LOW,
-                "estimated_hours": 20,
-                "subtasks": ["Identify external stakeholders", "Prepare stakeholder information packages", "Respond to financial inquiries", "Maintain stakeholder relationships", "Document all interactions"]
-            },
-            # CEO and Client Leadership Support tasks (3 tasks)
-            {
-                "id": "CL001",
-                "title": "Ad Hoc Issue Support",
-                "description": "Provide ad hoc support to emergent issues",
-                "category": "CEO and Client Leadership Support (1)",
-                "priority": TaskPriority.HIGH,
-                "estimated_hours": 40,
-                "subtasks": ["Establish issue escalation process", "Create rapid response framework", "Maintain issue tracking system", "Provide timely issue resolution", "Document lessons learned"]
-            },
-            {
-                "id": "CL002",
-                "title": "Presentation & Meeting Materials",
-                "description": "Prepare presentation and meeting materials for Client leadership",
-                "category": "CEO and Client Leadership Support (1)",
-                "priority": TaskPriority.MEDIUM,
-                "estimated_hours": 32,
-                "subtasks": ["Create presentation templates", "Develop executive dashboard content", "Prepare board meeting materials", "Design stakeholder presentations", "Maintain materials library"]
-            },
-            {
-                "id": "CL003",
-                "title": "Direct Meeting Support",
-                "description": "Provide direct meeting support to Client leadership",
-                "category": "CEO and Client Leadership Support (1)",
-                "priority": TaskPriority.MEDIUM,
-                "estimated_hours": 48,
-                "subtasks": ["Attend leadership meetings", "Provide real-time analytical support", "Take meeting notes and actions", "Follow up on meeting outcomes", "Coordinate meeting logistics"]
-            }
-        ]
+        # The database now holds exactly the defaults, so build them in memory
+        # rather than reading back the rows just inserted. They were all stamped
+        # by the server in one transaction, so its stamp is every row's stamp
+        stamp = self.db.query_scalar("SELECT max(updated_at) FROM tasks")
+        self._create_default_data(stamp)
+        self._loaded_at = stamp
     
     def _create_timeline_weeks(self):
         """Create timeline weeks in database"""
-        if not self.db.connection:
+        if not self.db.pool:
             return
-            
-        cursor = self.db.connection.cursor()
-        
-        start_date = datetime(2025, 9, 1)
-        end_date = datetime(2025, 12, 12)
-        current_date = start_date
-        week_num = 1
         
-        while current_date <= end_date:
-            week_end = min(current_date + timedelta(days=6), end_date)
+        # timeline_weeks has no unique key for ON CONFLICT, so guard against re-seeding
+        if self.db.query_scalar("SELECT EXISTS (SELECT 1 FROM timeline_weeks)"):
+            return
             
-            cursor.execute("""
+        weeks = [
+            (week_num, week_start.date(), week_end.date(), month, [])
+            for week_num, week_start, week_end, month in _default_timeline_weeks()
+        ]
+        
+        with self.db.get_conn() as conn, conn.cursor() as cursor:
+            execute_values(cursor, """
                 INSERT INTO timeline_weeks (week_number, start_date, end_date, month, assigned_tasks)
-                VALUES (%s, %s, %s, %s, %s)
+                VALUES %s
                 ON CONFLICT DO NOTHING
-            """, (
-                week_num,
-                current_date.date(),
-                week_end.date(),
-                current_date.strftime("%B %Y"),
-                []
-            ))
-            
-            current_date += timedelta(days=7)
-            week_num += 1
-        
-        cursor.close()
+            """, weeks, page_size=100)
     
-    def _create_default_data(self):
-        """Create default in-memory data for fallback"""
+    def _create_default_data(self, now: datetime = None):
+        """Create default in-memory data for fallback, stamping the tasks with `now` if given"""
         # Create default data structure when database is not available
         self._build_default_categories_structure()
-        self._build_default_tasks_structure()
+        self._build_default_tasks_structure(now)
         self._build_default_timeline_structure()
     
     def _build_default_categories_structure(self):
@@ -537,218 +1091,330 @@ class WorkplanDatabaseManager:
             }
         }
     
-    def _build_default_tasks_structure(self):
+    def _build_default_tasks_structure(self, now: datetime = None):
         """Build default tasks structure"""
-        tasks_data = self._get_default_tasks_data()
-        
-        # Create task objects and populate categories
-        for task_data in tasks_data:
-            task = Task(
-                id=task_data["id"],
-                title=task_data["title"],
-                description=task_data["description"],
-                category=task_data["category"],
-                priority=task_data["priority"],
-                status=TaskStatus.NOT_STARTED,
-                estimated_hours=task_data["estimated_hours"],
-                subtasks=task_data["subtasks"]
-            )
-            self.tasks[task.id] = task
-            
-            # Add to category tasks
+        # Copy the cached templates so edits never leak into other managers,
+        # stamped now rather than with the templates' build time
+        now = now or datetime.now()
+        self.tasks = {
+            task_id: replace(template, dependencies=[], subtasks=list(template.subtasks),
+                             created_at=now, updated_at=now)
+            for task_id, template in _default_task_objects().items()
+        }
+        
+        # Populate category tasks and indexes
+        self._by_status.clear()
+        self._by_priority.clear()
+        self._category_counters.clear()
+        self._columns = _TaskColumns()
+        for task in self.tasks.values():
+            self._index_task(task)
             if task.category in self.categories:
-                task_dict = {
-                    'id': task.id,
-                    'title': task.title,
-                    'description': task.description,
-                    'priority': task.priority,
-                    'estimated_hours': task.estimated_hours,
-                    'subtasks': task.subtasks
-                }
-                self.categories[task.category]['tasks'].append(task_dict)
+                self.categories[task.category]['tasks'].append(task)
     
     def _build_default_timeline_structure(self):
         """Build default timeline structure"""
-        start_date = datetime(2025, 9, 1)
-        end_date = datetime(2025, 12, 12)
-        current_date = start_date
-        week_num = 1
-        
-        while current_date <= end_date:
-            week_end = min(current_date + timedelta(days=6), end_date)
-            self.timeline_weeks.append({
-                "week_number": week_num,
-                "start_date": current_date,
-                "end_date": week_end,
-                "month": current_date.strftime("%B %Y"),
-                "tasks": []
-            })
-            current_date += timedelta(days=7)
-            week_num += 1
+        self._timeline_df = _timeline_frame(
+            (week_num, week_start, week_end, month, [])
+            for week_num, week_start, week_end, month in _default_timeline_weeks()
+        )
     
     # Database operations
-    def save_task(self, task: Task):
-        """Save or update task in database"""
-        if not self.db.connection:
+    def save_tasks_many(self, tasks: List[Task]):
+        """Save or update several tasks in one multi-row upsert"""
+        if not self.db.pool or not tasks:
             return
-            
-        cursor = self.db.connection.cursor()
-        
-        cursor.execute("""
-            INSERT INTO tasks (
-                id, title, description, category, priority, status,
-                start_date, end_date, estimated_hours, actual_hours,
-                dependencies, assigned_to, completion_percentage, notes,
-                subtasks, updated_at
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
-                title = EXCLUDED.title,
-                description = EXCLUDED.description,
-                priority = EXCLUDED.priority,
-                status = EXCLUDED.status,
-                start_date = EXCLUDED.start_date,
-                end_date = EXCLUDED.end_date,
-                estimated_hours = EXCLUDED.estimated_hours,
-                actual_hours = EXCLUDED.actual_hours,
-                dependencies = EXCLUDED.dependencies,
-                assigned_to = EXCLUDED.assigned_to,
-                completion_percentage = EXCLUDED.completion_percentage,
-                notes = EXCLUDED.notes,
-                subtasks = EXCLUDED.subtasks,
-                updated_at = EXCLUDED.updated_at
-        """, (
+        
+        rows = [(
             task.id, task.title, task.description, task.category,
             task.priority.value, task.status.value,
             task.start_date, task.end_date, task.estimated_hours, task.actual_hours,
             task.dependencies, task.assigned_to, task.completion_percentage,
-            task.notes, task.subtasks, datetime.now()
-        ))
+            task.notes, task.subtasks
+        ) for task in tasks]
+        
+        with self.db.get_conn() as conn, conn.cursor() as cursor:
+            # One page, so the whole batch is a single statement and commit
+            saved = execute_values(cursor, SAVE_TASKS_SQL, rows, page_size=len(rows), fetch=True)
         
-        cursor.close()
+        tasks_by_id = {task.id: task for task in tasks}
+        for row in saved:
+            tasks_by_id[row['id']].updated_at = row['updated_at']
+            self._note_write(row['id'], row['updated_at'])
+    
+    def _note_write(self, task_id: str, updated_at: datetime):
+        """Remember a row this manager wrote itself, so the next incremental
+        reload doesn't treat our own edit as an external change"""
+        self._own_writes[task_id] = updated_at
+    
+    def _persist_task_update(self, task: Task, statement: str, params: Tuple):
+        """Sync an edited task's numeric columns, run its prepared UPDATE and
+        refresh the in-memory task from the returned row"""
+        self._columns.upsert(task)
+        if self.db.pool:
+            row = self.db.execute_prepared(statement, params)
+            if row:
+                self._store_task(Task._from_row(row))
+                self._note_write(row['id'], row['updated_at'])
+        self.data_version = next(_DATA_VERSIONS)
+    
+    def _update_column(self, task_id: str, column: str, value) -> bool:
+        """Set a single task column in memory and through its prepared UPDATE"""
+        with self._write_lock:
+            task = self.tasks.get(task_id)
+            if task is None:
+                return False
+            setattr(task, column, value)
+            task.updated_at = datetime.now()  # Replaced by the stored stamp when persisted
+            self._persist_task_update(task, f'update_task_{column}', (value, task_id))
+            return True
     
     def update_task_title(self, task_id: str, new_title: str):
         """Update task title"""
-        if task_id in self.tasks:
-            self.tasks[task_id].title = new_title
-            self.tasks[task_id].updated_at = datetime.now()
-            self.save_task(self.tasks[task_id])
-            return True
-        return False
+        return self._update_column(task_id, 'title', new_title)
     
     def update_task_description(self, task_id: str, new_description: str):
         """Update task description"""
-        if task_id in self.tasks:
-            self.tasks[task_id].description = new_description
-            self.tasks[task_id].updated_at = datetime.now()
-            self.save_task(self.tasks[task_id])
-            return True
-        return False
+        return self._update_column(task_id, 'description', new_description)
+    
+    def _set_status(self, task: Task, status: TaskStatus):
+        """Change a task's status, moving it between status index entries"""
+        self._by_status[task.status].discard(task.id)
+        task.status = status
+        self._by_status[status].add(task.id)
     
     def update_task_status(self, task_id: str, status: TaskStatus, completion_percentage: float = None):
         """Update task status and completion"""
-        if task_id in self.tasks:
-            self.tasks[task_id].status = status
-            if completion_percentage is not None:
-                self.tasks[task_id].completion_percentage = completion_percentage
-            self.tasks[task_id].updated_at = datetime.now()
-            self.save_task(self.tasks[task_id])
+        with self._write_lock:
+            if task_id in self.tasks:
+                task = self.tasks[task_id]
+                self._set_status(task, status)
+                if completion_percentage is not None:
+                    task.completion_percentage = completion_percentage
+                task.updated_at = datetime.now()
+                self._persist_task_update(task, 'update_task_status', (
+                    status.value, task.completion_percentage, task_id
+                ))
     
     def update_task_hours(self, task_id: str, actual_hours: int):
         """Update actual hours for a task"""
-        if task_id in self.tasks:
-            self.tasks[task_id].actual_hours = actual_hours
-            self.tasks[task_id].updated_at = datetime.now()
-            self.save_task(self.tasks[task_id])
+        return self._update_column(task_id, 'actual_hours', actual_hours)
+    
+    def update_task_bulk(self, task_id: str, status: TaskStatus, completion_percentage: float, actual_hours: int):
+        """Update status, completion and actual hours in a single write"""
+        with self._write_lock:
+            if task_id in self.tasks:
+                task = self.tasks[task_id]
+                self._set_status(task, status)
+                task.completion_percentage = completion_percentage
+                task.actual_hours = actual_hours
+                task.updated_at = datetime.now()
+                self._persist_task_update(task, 'update_task_bulk', (
+                    status.value, completion_percentage, actual_hours, task_id
+                ))
+                return True
+            return False
     
     def create_new_task(self, category: str, title: str, description: str, priority: str, estimated_hours: int):
         """Create a new task"""
-        # Generate new task ID
-        category_prefix = {
-            "Business Operations Development (2)": "BO",
-            "Financial Excellence (2)": "FE",
-            "CEO and Client Leadership Support (1)": "CL"
-        }.get(category, "XX")
-        
-        # Find next available ID number
-        existing_ids = [task_id for task_id in self.tasks.keys() if task_id.startswith(category_prefix)]
-        next_num = len(existing_ids) + 1
-        new_id = f"{category_prefix}{next_num:03d}"
-        
-        # Ensure unique ID
-        while new_id in self.tasks:
-            next_num += 1
-            new_id = f"{category_prefix}{next_num:03d}"
-        
-        # Create new task
-        new_task = Task(
-            id=new_id,
-            title=title,
-            description=description,
-            category=category,
-            priority=TaskPriority(priority),
-            status=TaskStatus.NOT_STARTED,
-            estimated_hours=estimated_hours
-        )
-        
-        self.tasks[new_id] = new_task
-        self.save_task(new_task)
-        
-        return new_id
+        return self.create_tasks_bulk([{
+            'category': category,
+            'title': title,
+            'description': description,
+            'priority': priority,
+            'estimated_hours': estimated_hours
+        }])[0]
+    
+    def create_tasks_bulk(self, specs: List[Dict[str, Any]]) -> List[str]:
+        """Create several tasks at once, persisting them in a single statement.
+        Each spec has the create_new_task arguments as keys; returns the new IDs."""
+        with self._write_lock:
+            now = datetime.now()
+            new_tasks = []
+            for spec in specs:
+                # Generate new task ID from the per-prefix counter
+                category_prefix = _CATEGORY_PREFIXES.get(spec['category'], "XX")
+                next_num = self._category_counters.get(category_prefix, 0) + 1
+                
+                new_task = Task(
+                    id=f"{category_prefix}{next_num:03d}",
+                    title=spec['title'],
+                    description=spec['description'],
+                    category=spec['category'],
+                    priority=TaskPriority(spec['priority']),
+                    status=TaskStatus.NOT_STARTED,
+                    estimated_hours=spec['estimated_hours'],
+                    created_at=now,
+                    updated_at=now
+                )
+                self._store_task(new_task)
+                new_tasks.append(new_task)
+            
+            self.save_tasks_many(new_tasks)
+            self.data_version = next(_DATA_VERSIONS)
+            
+            return [task.id for task in new_tasks]
     
     # Read operations
-    def get_all_categories(self) -> Dict[str, Any]:
-        """Get all categories with their tasks"""
-        return self.categories
+    def get_all_categories(self) -> MappingProxyType:
+        """Get all categories with their tasks, as a read-only view"""
+        return MappingProxyType(self.categories)
     
-    def get_category_tasks(self, category_name: str) -> List[Dict]:
-        """Get all tasks for a specific category"""
-        return self.categories.get(category_name, {}).get("tasks", [])
+    def get_category_tasks(self, category_name: str) -> Tuple[Task, ...]:
+        """Get all tasks for a specific category, as a tuple cached per data version"""
+        version = self.data_version
+        if self._category_tasks_cache_version != version:
+            self._category_tasks_cache = {}
+            self._category_tasks_cache_version = version
+        elif category_name in self._category_tasks_cache:
+            return self._category_tasks_cache[category_name]
+        
+        tasks = tuple(self.categories.get(category_name, {}).get("tasks", ()))
+        self._category_tasks_cache[category_name] = tasks
+        return tasks
     
     def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """Get specific task by ID"""
         return self.tasks.get(task_id)
     
+    def get_tasks_by_ids(self, task_ids) -> Dict[str, Task]:
+        """Get several tasks at once, fetching any unknown IDs in one query"""
+        found = {}
+        missing = []
+        for task_id in task_ids:
+            task = self.tasks.get(task_id)
+            if task:
+                found[task_id] = task
+            else:
+                missing.append(task_id)
+        
+        if missing and self.db.pool:
+            with self.db.get_conn() as conn, conn.cursor() as cursor:
+                cursor.execute("SELECT * FROM tasks WHERE id = ANY(%s::text[])", (missing,))
+                for row in cursor.fetchall():
+                    found[row['id']] = Task._from_row(row)
+        
+        return found
+    
+    def query_tasks(self, category: str = None, status: str = None, priority: str = None,
+                    limit: int = None, offset: int = None) -> Tuple[List[Task], int]:
+        """Get one page of tasks matching the given filters, plus the total match count"""
+        filters = {"category": category, "status": status, "priority": priority}
+        filters = {column: value for column, value in filters.items() if value is not None}
+        offset = offset or 0
+        
+        if not self.db.pool:
+            # Narrow by the status/priority indexes, ordered by ID like the SQL path
+            task_ids = set(self.tasks)
+            if status is not None:
+                task_ids &= self._by_status[TaskStatus(status)]
+            if priority is not None:
+                task_ids &= self._by_priority[TaskPriority(priority)]
+            matches = [
+                self.tasks[task_id] for task_id in sorted(task_ids)
+                if category is None or self.tasks[task_id].category == category
+            ]
+            end = offset + limit if limit is not None else None
+            return matches[offset:end], len(matches)
+        
+        query = "SELECT *, COUNT(*) OVER () AS total_count FROM tasks"
+        if filters:
+            query += " WHERE " + " AND ".join(f"{column} = %s" for column in filters)
+        query += " ORDER BY id LIMIT %s OFFSET %s"
+        
+        with self.db.get_conn() as conn, conn.cursor() as cursor:
+            cursor.execute(query, (*filters.values(), limit, offset))
+            rows = cursor.fetchall()
+        
+        if not rows:
+            # Past the last page, so the window count is unavailable; count directly
+            if offset == 0:
+                return [], 0
+            _, total = self.query_tasks(category, status, priority, limit=1)
+            return [], total
+        
+        return [Task._from_row(row) for row in rows], rows[0]['total_count']
+    
+    def get_by_status(self, status: TaskStatus) -> List[Task]:
+        """Get all tasks with the given status"""
+        return [self.tasks[task_id] for task_id in sorted(self._by_status[status])]
+    
+    def get_status_counts(self) -> Counter:
+        """Count tasks per status value, read off the status index sizes"""
+        return Counter({status.value: len(task_ids) for status, task_ids in self._by_status.items() if task_ids})
+    
+    def get_by_priority(self, priority: TaskPriority) -> List[Task]:
+        """Get all tasks with the given priority"""
+        return [self.tasks[task_id] for task_id in sorted(self._by_priority[priority])]
+    
     def get_timeline_data(self) -> List[Dict]:
-        """Get complete timeline data"""
-        return self.timeline_weeks
+        """Get complete timeline data as one dict per week.
+        Deprecated: use get_timeline_frame for anything beyond JSON output."""
+        return self._timeline_df.to_dict(orient='records')
+    
+    def get_timeline_frame(self) -> pd.DataFrame:
+        """Get the timeline as a DataFrame with one row per week"""
+        return self._timeline_df
     
     def calculate_category_progress(self, category_name: str) -> Dict[str, float]:
         """Calculate progress metrics for a category"""
-        category_tasks = [task for task in self.tasks.values() if task.category == category_name]
+        version = self.data_version
+        if self._category_progress_cache_version != version:
+            self._category_progress_cache = {}
+            self._category_progress_cache_version = version
+        elif category_name in self._category_progress_cache:
+            return self._category_progress_cache[category_name]
         
-        if not category_tasks:
-            return {"completion": 0.0, "progress": 0.0}
+        progress = self._calculate_category_progress(category_name)
+        self._category_progress_cache[category_name] = progress
+        return progress
+    
+    def _calculate_category_progress(self, category_name: str) -> Dict[str, float]:
+        """Calculate progress metrics for a category, uncached"""
+        totals = self._columns.totals_for(category_name)
         
-        total_tasks = len(category_tasks)
-        completed_tasks = sum(1 for task in category_tasks if task.status == TaskStatus.COMPLETED)
-        total_progress = sum(task.completion_percentage for task in category_tasks)
+        if totals is None:
+            # Same shape as an empty category's entry in the project summary
+            return dict(_EMPTY_CATEGORY_SUMMARY)
         
-        estimated_hours = sum(task.estimated_hours or 0 for task in category_tasks)
-        actual_hours = sum(task.actual_hours or 0 for task in category_tasks)
+        total_tasks = totals['tasks']
+        estimated_hours = totals['estimated_hours']
+        actual_hours = totals['actual_hours']
         
         return {
-            "completion_percentage": (completed_tasks / total_tasks) * 100,
-            "average_progress": total_progress / total_tasks,
+            "completion_percentage": (totals['completed'] / total_tasks) * 100,
+            "average_progress": totals['progress'] / total_tasks,
             "estimated_hours": estimated_hours,
             "actual_hours": actual_hours,
             "hours_variance": actual_hours - estimated_hours if actual_hours > 0 else 0
         }
     
-    def get_project_summary(self) -> Dict[str, Any]:
-        """Get overall project summary statistics"""
-        total_tasks = len(self.tasks)
-        completed_tasks = sum(1 for task in self.tasks.values() if task.status == TaskStatus.COMPLETED)
-        in_progress_tasks = sum(1 for task in self.tasks.values() if task.status == TaskStatus.IN_PROGRESS)
-        
-        total_estimated_hours = sum(task.estimated_hours or 0 for task in self.tasks.values())
-        total_actual_hours = sum(task.actual_hours or 0 for task in self.tasks.values())
-        
-        overall_progress = sum(task.completion_percentage for task in self.tasks.values()) / total_tasks if total_tasks > 0 else 0
-        
-        # Category breakdowns
+    @staticmethod
+    def _empty_category_totals() -> Dict[str, float]:
+        """Fresh per-category accumulator for summary building"""
+        return {'tasks': 0, 'completed': 0, 'in_progress': 0,
+                'estimated_hours': 0, 'actual_hours': 0, 'progress': 0.0}
+    
+    def _summarize(self, category_totals: Dict[str, Dict[str, float]], category_names) -> Dict[str, Any]:
+        """Derive the project summary from per-category task totals"""
         category_summaries = {}
-        for category_name in self.categories.keys():
-            category_summaries[category_name] = self.calculate_category_progress(category_name)
+        for name in category_names:
+            totals = category_totals[name]
+            count = totals['tasks']
+            category_summaries[name] = {
+                "completion_percentage": (totals['completed'] / count) * 100 if count else 0.0,
+                "average_progress": totals['progress'] / count if count else 0.0,
+                "estimated_hours": totals['estimated_hours'],
+                "actual_hours": totals['actual_hours'],
+                "hours_variance": totals['actual_hours'] - totals['estimated_hours'] if totals['actual_hours'] > 0 else 0
+            }
+        
+        total_tasks = sum(totals['tasks'] for totals in category_totals.values())
+        completed_tasks = sum(totals['completed'] for totals in category_totals.values())
+        in_progress_tasks = sum(totals['in_progress'] for totals in category_totals.values())
+        total_estimated_hours = sum(totals['estimated_hours'] for totals in category_totals.values())
+        total_actual_hours = sum(totals['actual_hours'] for totals in category_totals.values())
+        total_progress = sum(totals['progress'] for totals in category_totals.values())
         
         return {
             "total_tasks": total_tasks,
@@ -756,15 +1422,93 @@ class WorkplanDatabaseManager:
             "in_progress_tasks": in_progress_tasks,
             "not_started_tasks": total_tasks - completed_tasks - in_progress_tasks,
             "overall_completion": (completed_tasks / total_tasks) * 100 if total_tasks > 0 else 0,
-            "overall_progress": overall_progress,
+            "overall_progress": total_progress / total_tasks if total_tasks > 0 else 0,
             "total_estimated_hours": total_estimated_hours,
             "total_actual_hours": total_actual_hours,
             "hours_variance": total_actual_hours - total_estimated_hours,
             "categories": category_summaries,
-            "timeline_weeks": len(self.timeline_weeks)
+            "timeline_weeks": len(self._timeline_df)
         }
+    
+    def get_project_summary(self) -> Dict[str, Any]:
+        """Get overall project summary statistics"""
+        version = self.data_version
+        if self._summary_cache_version == version:
+            return self._summary_cache
+        
+        if not self.tasks:
+            # Fresh install or empty database: skip the aggregation entirely
+            summary = {
+                **_EMPTY_SUMMARY,
+                "categories": {name: dict(_EMPTY_CATEGORY_SUMMARY) for name in self.categories},
+                "timeline_weeks": len(self._timeline_df)
+            }
+            self._summary_cache_version, self._summary_cache = version, summary
+            return summary
+        
+        # Per-category totals come from the NumPy columns; categories without
+        # tasks still get a zeroed entry
+        category_totals = {name: self._empty_category_totals() for name in self.categories}
+        category_totals.update(self._columns.category_totals())
+        
+        summary = self._summarize(category_totals, self.categories)
+        self._summary_cache_version, self._summary_cache = version, summary
+        return summary
+
+    def load_dashboard_snapshot(self) -> Dict[str, Any]:
+        """Get the project summary and category details in one database round-trip"""
+        if not self.db.pool:
+            category_info = {
+                name: {key: value for key, value in data.items() if key != 'tasks'}
+                for name, data in self.categories.items()
+            }
+            return {"summary": self.get_project_summary(), "categories": category_info}
+        
+        with self.db.get_conn() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT c.name, c.description, c.team_size, c.total_estimated_hours,
+                       COALESCE(p.task_count, 0) AS task_count,
+                       COALESCE(p.completed_tasks, 0) AS completed_tasks,
+                       COALESCE(p.in_progress_tasks, 0) AS in_progress_tasks,
+                       COALESCE(p.estimated_hours, 0) AS estimated_hours,
+                       COALESCE(p.actual_hours, 0) AS actual_hours,
+                       COALESCE(p.total_progress, 0) AS total_progress
+                FROM categories c
+                LEFT JOIN category_progress p ON p.category = c.name
+                ORDER BY c.name
+            """)
+            rows = cursor.fetchall()
+        
+        category_info = {}
+        category_totals = {}
+        for row in rows:
+            category_info[row['name']] = {
+                'description': row['description'],
+                'team_size': row['team_size'],
+                'total_estimated_hours': row['total_estimated_hours']
+            }
+            category_totals[row['name']] = {
+                'tasks': row['task_count'],
+                'completed': row['completed_tasks'],
+                'in_progress': row['in_progress_tasks'],
+                'estimated_hours': row['estimated_hours'],
+                'actual_hours': row['actual_hours'],
+                'progress': row['total_progress']
+            }
+        
+        summary = self._summarize(category_totals, category_totals)
+        return {"summary": summary, "categories": category_info}
 
 # Helper function
+def _manager_is_fresh(manager: WorkplanDatabaseManager) -> bool:
+    """Catch the cached manager up with external database writes before reuse"""
+    return manager.refresh_if_stale()
+
+@st.cache_resource(validate=_manager_is_fresh)
+def get_workplan_manager() -> WorkplanDatabaseManager:
+    """Get the workplan database manager shared by every session"""
+    return WorkplanDatabaseManager()
+
 def initialize_workplan_db_manager() -> WorkplanDatabaseManager:
     """Initialize workplan database manager"""
-    return WorkplanDatabaseManager()
\ No newline at end of file
+    return get_workplan_manager()
\ No newline at end of file
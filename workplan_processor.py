@@ -3,15 +3,22 @@ Workplan Data Processor for 3-Month Client Engagement
 Handles comprehensive task management, timeline tracking, and progress monitoring
 """
 
-import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional
+import functools
 import json
 import os
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+import sys
+from collections import deque
+from datetime import date, datetime, timedelta
+from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
 class TaskPriority(Enum):
     HIGH = "High"
     MEDIUM = "Medium"
@@ -24,7 +31,7 @@ class TaskStatus(Enum):
     BLOCKED = "Blocked"
     ON_HOLD = "On Hold"
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: str
     title: str
@@ -44,26 +51,141 @@ class Task:
     def __post_init__(self):
         if self.dependencies is None:
             self.dependencies = []
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field dict for serialization, without asdict's deep copy"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+def _lazy_date(slot) -> property:
+    """Wrap a Task date slot so an ISO string stored in it is parsed on first
+    read, and the parsed datetime kept in the slot for later reads"""
+    def get(task):
+        value = slot.__get__(task)
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+            slot.__set__(task, value)
+        return value
+    return property(get, slot.__set__)
+
+# Saved tasks are loaded with their dates as raw ISO strings; most readers
+# only look at status and progress, so the dates are parsed when first read
+Task.start_date = _lazy_date(Task.__dict__['start_date'])
+Task.end_date = _lazy_date(Task.__dict__['end_date'])
+
+def _json_default(value):
+    """Serialize values the JSON encoders don't handle natively"""
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+# Integer code for each status, in enum order, for the task columns
+_STATUS_CODES = {status: code for code, status in enumerate(TaskStatus)}
+_COMPLETED_CODE = _STATUS_CODES[TaskStatus.COMPLETED]
+_IN_PROGRESS_CODE = _STATUS_CODES[TaskStatus.IN_PROGRESS]
+
+# Per-category summary entry for a category without tasks
+_EMPTY_CATEGORY_SUMMARY = {
+    "completion_percentage": 0.0,
+    "average_progress": 0.0,
+    "estimated_hours": 0,
+    "actual_hours": 0,
+    "hours_variance": 0
+}
 
 class WorkplanManager:
     def __init__(self, excel_path: str = None):
         """Initialize workplan manager"""
         self.excel_path = excel_path or '/Users/JDKristenson/Desktop/Client_3_month_initial_workplan.xlsx'
+        self.data_version = 0  # Bumped on every change to the task data
+        self._summary_cache_version = None
+        self._summary_cache = None
+        self._category_progress_cache_version = None
+        self._category_progress_cache = {}
+    
+    # The workplan is built lazily, on first access to any of these
+    @functools.cached_property
+    def categories(self) -> Dict[str, Any]:
+        self.load_workplan_data()
+        return self.categories
+    
+    @functools.cached_property
+    def tasks(self) -> Dict[str, Task]:
+        self.load_workplan_data()
+        return self.tasks
+    
+    @functools.cached_property
+    def timeline_weeks(self) -> List[Dict]:
+        self.load_workplan_data()
+        return self.timeline_weeks
+    
+    def _ensure_built(self):
+        """Build the workplan now if none of the lazy attributes has been read yet"""
+        if 'tasks' not in self.__dict__:
+            self.load_workplan_data()
+        
+    def load_workplan_data(self, load_path: str = None):
+        """Build the comprehensive workplan structure, or restore it from a
+        saved JSON state at load_path if one is given and exists"""
         self.categories = {}
         self.tasks = {}
         self.timeline_weeks = []
-        self.load_workplan_data()
         
-    def load_workplan_data(self):
-        """Load workplan data from Excel and build comprehensive structure"""
-        try:
-            df = pd.read_excel(self.excel_path, sheet_name='3 Month Workplan')
-            self._build_comprehensive_categories()
-            self._create_timeline()
-            
-        except Exception as e:
-            print(f"Error loading workplan data: {e}")
-            self._create_default_structure()
+        # The structure is defined in code; the Excel sheet was parsed here
+        # but never used, so it is no longer read at all
+        if load_path and self.load_workplan_data_from_json(load_path):
+            return
+        self._build_comprehensive_categories()
+        self._create_timeline()
+        self._index_dependencies()
+        self._build_columns()
+    
+    def _index_dependencies(self):
+        """Invert the task dependencies and order the tasks topologically
+        (Kahn's algorithm), once per build or load"""
+        self._dependents = {task_id: [] for task_id in self.tasks}
+        in_degree = {}
+        for task_id, task in self.tasks.items():
+            known_dependencies = [dependency for dependency in task.dependencies if dependency in self.tasks]
+            in_degree[task_id] = len(known_dependencies)
+            for dependency in known_dependencies:
+                self._dependents[dependency].append(task_id)
+        
+        ready = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
+        self._topo_order = []
+        while ready:
+            task_id = ready.popleft()
+            self._topo_order.append(task_id)
+            for dependent in self._dependents[task_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+        
+        # Tasks caught in a dependency cycle never reach zero; keep them, last
+        if len(self._topo_order) < len(self.tasks):
+            ordered = set(self._topo_order)
+            self._topo_order.extend(task_id for task_id in self.tasks if task_id not in ordered)
+    
+    def _build_columns(self):
+        """Mirror the numeric task fields into NumPy columns, one row per task
+        in self.tasks order, and mark the data as changed"""
+        tasks = list(self.tasks.values())
+        self._task_index = {task.id: row for row, task in enumerate(tasks)}
+        self._category_ids = {name: code for code, name in enumerate(self.categories)}
+        for task in tasks:
+            self._category_ids.setdefault(task.category, len(self._category_ids))
+        
+        self._status = np.array([_STATUS_CODES[task.status] for task in tasks], dtype=np.int8)
+        self._est_hours = np.array([task.estimated_hours or 0 for task in tasks], dtype=np.int64)
+        self._act_hours = np.array([task.actual_hours or 0 for task in tasks], dtype=np.int64)
+        self._completion = np.array([task.completion_percentage for task in tasks], dtype=np.float64)
+        self._category_codes = np.array([self._category_ids[task.category] for task in tasks], dtype=np.int16)
+        
+        # Estimates never change after a build or load, so total them once
+        self._category_estimated_hours = np.bincount(
+            self._category_codes, weights=self._est_hours, minlength=len(self._category_ids)
+        ).astype(np.int64)
+        self._total_estimated_hours = int(self._est_hours.sum())
+        self.data_version += 1
     
     def _build_comprehensive_categories(self):
         """Build out comprehensive category structure with detailed tasks"""
@@ -393,44 +515,47 @@ class WorkplanManager:
         }
         
         # Create task objects
-        for category_name, category_data in self.categories.items():
-            for task_data in category_data["tasks"]:
-                task = Task(
-                    id=task_data["id"],
-                    title=task_data["title"],
-                    description=task_data["description"],
-                    category=category_name,
-                    priority=task_data["priority"],
-                    status=TaskStatus.NOT_STARTED,
-                    estimated_hours=task_data["estimated_hours"],
-                    dependencies=task_data.get("dependencies", [])
-                )
-                self.tasks[task.id] = task
+        self.tasks = {
+            task_data["id"]: Task(
+                id=task_data["id"],
+                title=task_data["title"],
+                description=task_data["description"],
+                category=category_name,
+                priority=task_data["priority"],
+                status=TaskStatus.NOT_STARTED,
+                estimated_hours=task_data["estimated_hours"],
+                dependencies=task_data.get("dependencies", [])
+            )
+            for category_name, category_data in self.categories.items()
+            for task_data in category_data["tasks"]
+        }
     
     def _create_timeline(self):
         """Create 3-month timeline structure"""
-        start_date = datetime(2025, 9, 1)  # Sept 1, 2025
-        end_date = datetime(2025, 12, 12)  # Dec 12, 2025
+        start_date = date(2025, 9, 1)  # Sept 1, 2025
+        end_date = date(2025, 12, 12)  # Dec 12, 2025
+        
+        week_starts = [start_date + timedelta(days=7 * week) for week in range((end_date - start_date).days // 7 + 1)]
         
-        current_date = start_date
-        week_num = 1
+        # strftime once per month rather than once per week
+        month_starts = {(week_start.year, week_start.month): week_start for week_start in week_starts}
+        month_labels = {month: week_start.strftime("%B %Y") for month, week_start in month_starts.items()}
         
-        while current_date <= end_date:
-            week_end = min(current_date + timedelta(days=6), end_date)
-            self.timeline_weeks.append({
+        self.timeline_weeks = [
+            {
                 "week_number": week_num,
-                "start_date": current_date,
-                "end_date": week_end,
-                "month": current_date.strftime("%B %Y"),
+                "start_date": week_start,
+                "end_date": min(week_start + timedelta(days=6), end_date),
+                "month": month_labels[week_start.year, week_start.month],
                 "tasks": []
-            })
-            current_date += timedelta(days=7)
-            week_num += 1
+            }
+            for week_num, week_start in enumerate(week_starts, start=1)
+        ]
+        self._index_timeline()
     
-    def _create_default_structure(self):
-        """Create default structure if Excel loading fails"""
-        self._build_comprehensive_categories()
-        self._create_timeline()
+    def _index_timeline(self):
+        """Mirror each week's task list in a set for O(1) membership checks"""
+        self._week_task_sets = [set(week["tasks"]) for week in self.timeline_weeks]
     
     def get_all_categories(self) -> Dict[str, Any]:
         """Get all categories with their tasks"""
@@ -444,24 +569,50 @@ class WorkplanManager:
         """Get specific task by ID"""
         return self.tasks.get(task_id)
     
+    def get_dependent_tasks(self, task_id: str) -> List[Task]:
+        """Get the tasks that directly depend on a task"""
+        self._ensure_built()
+        return [self.tasks[dependent] for dependent in self._dependents.get(task_id, [])]
+    
+    def get_tasks_in_dependency_order(self) -> List[Task]:
+        """Get all tasks ordered so each comes after the tasks it depends on"""
+        self._ensure_built()
+        return [self.tasks[task_id] for task_id in self._topo_order]
+    
+    def get_ready_tasks(self) -> List[Task]:
+        """Get unfinished tasks whose known dependencies are all completed"""
+        return [
+            task for task in self.get_tasks_in_dependency_order()
+            if task.status != TaskStatus.COMPLETED
+            and all(self.tasks[dependency].status == TaskStatus.COMPLETED
+                    for dependency in task.dependencies if dependency in self.tasks)
+        ]
+    
     def update_task_status(self, task_id: str, status: TaskStatus, completion_percentage: float = None):
         """Update task status and completion"""
         if task_id in self.tasks:
+            row = self._task_index[task_id]
             self.tasks[task_id].status = status
+            self._status[row] = _STATUS_CODES[status]
             if completion_percentage is not None:
                 self.tasks[task_id].completion_percentage = completion_percentage
+                self._completion[row] = completion_percentage
+            self.data_version += 1
     
     def update_task_hours(self, task_id: str, actual_hours: int):
         """Update actual hours for a task"""
         if task_id in self.tasks:
             self.tasks[task_id].actual_hours = actual_hours
+            self._act_hours[self._task_index[task_id]] = actual_hours or 0
+            self.data_version += 1
     
     def assign_task_to_week(self, task_id: str, week_number: int):
         """Assign a task to a specific week"""
         if week_number <= len(self.timeline_weeks):
-            week = self.timeline_weeks[week_number - 1]
-            if task_id not in week["tasks"]:
-                week["tasks"].append(task_id)
+            week_tasks = self._week_task_sets[week_number - 1]
+            if task_id not in week_tasks:
+                week_tasks.add(task_id)
+                self.timeline_weeks[week_number - 1]["tasks"].append(task_id)
     
     def get_timeline_data(self) -> List[Dict]:
         """Get complete timeline data"""
@@ -469,17 +620,31 @@ class WorkplanManager:
     
     def calculate_category_progress(self, category_name: str) -> Dict[str, float]:
         """Calculate progress metrics for a category"""
-        category_tasks = [task for task in self.tasks.values() if task.category == category_name]
+        self._ensure_built()
+        version = self.data_version
+        if self._category_progress_cache_version != version:
+            self._category_progress_cache = {}
+            self._category_progress_cache_version = version
+        elif category_name in self._category_progress_cache:
+            return self._category_progress_cache[category_name]
+        
+        progress = self._calculate_category_progress(category_name)
+        self._category_progress_cache[category_name] = progress
+        return progress
+    
+    def _calculate_category_progress(self, category_name: str) -> Dict[str, float]:
+        """Calculate progress metrics for a category, uncached"""
+        mask = self._category_codes == self._category_ids.get(category_name, -1)
+        total_tasks = int(np.count_nonzero(mask))
         
-        if not category_tasks:
-            return {"completion": 0.0, "progress": 0.0}
+        if not total_tasks:
+            return dict(_EMPTY_CATEGORY_SUMMARY)
         
-        total_tasks = len(category_tasks)
-        completed_tasks = sum(1 for task in category_tasks if task.status == TaskStatus.COMPLETED)
-        total_progress = sum(task.completion_percentage for task in category_tasks)
+        completed_tasks = int(np.count_nonzero(self._status[mask] == _COMPLETED_CODE))
+        total_progress = float(self._completion[mask].sum())
         
-        estimated_hours = sum(task.estimated_hours or 0 for task in category_tasks)
-        actual_hours = sum(task.actual_hours or 0 for task in category_tasks)
+        estimated_hours = int(self._category_estimated_hours[self._category_ids[category_name]])
+        actual_hours = int(self._act_hours[mask].sum())
         
         return {
             "completion_percentage": (completed_tasks / total_tasks) * 100,
@@ -491,19 +656,48 @@ class WorkplanManager:
     
     def get_project_summary(self) -> Dict[str, Any]:
         """Get overall project summary statistics"""
-        total_tasks = len(self.tasks)
-        completed_tasks = sum(1 for task in self.tasks.values() if task.status == TaskStatus.COMPLETED)
-        in_progress_tasks = sum(1 for task in self.tasks.values() if task.status == TaskStatus.IN_PROGRESS)
+        self._ensure_built()
+        version = self.data_version
+        if self._summary_cache_version == version:
+            return self._summary_cache
         
-        total_estimated_hours = sum(task.estimated_hours or 0 for task in self.tasks.values())
-        total_actual_hours = sum(task.actual_hours or 0 for task in self.tasks.values())
+        summary = self._calculate_project_summary()
+        self._summary_cache_version, self._summary_cache = version, summary
+        return summary
+    
+    def _calculate_project_summary(self) -> Dict[str, Any]:
+        """Get overall project summary statistics, uncached"""
+        # Per-category totals bucketed from the task columns, indexed by category code
+        n_categories = len(self._category_ids)
+        counts = np.bincount(self._category_codes, minlength=n_categories)
+        completed = np.bincount(self._category_codes[self._status == _COMPLETED_CODE], minlength=n_categories)
+        progress = np.bincount(self._category_codes, weights=self._completion, minlength=n_categories)
+        actual = np.bincount(self._category_codes, weights=self._act_hours, minlength=n_categories)
         
-        overall_progress = sum(task.completion_percentage for task in self.tasks.values()) / total_tasks if total_tasks > 0 else 0
+        total_tasks = len(self.tasks)
+        completed_tasks = int(completed.sum())
+        in_progress_tasks = int(np.count_nonzero(self._status == _IN_PROGRESS_CODE))
+        total_estimated_hours = self._total_estimated_hours
+        total_actual_hours = int(self._act_hours.sum())
+        overall_progress = float(self._completion.sum()) / total_tasks if total_tasks > 0 else 0
         
         # Category breakdowns
         category_summaries = {}
         for category_name in self.categories.keys():
-            category_summaries[category_name] = self.calculate_category_progress(category_name)
+            code = self._category_ids[category_name]
+            count = int(counts[code])
+            if not count:
+                category_summaries[category_name] = dict(_EMPTY_CATEGORY_SUMMARY)
+                continue
+            actual_hours = int(actual[code])
+            estimated_hours = int(self._category_estimated_hours[code])
+            category_summaries[category_name] = {
+                "completion_percentage": (int(completed[code]) / count) * 100,
+                "average_progress": float(progress[code]) / count,
+                "estimated_hours": estimated_hours,
+                "actual_hours": actual_hours,
+                "hours_variance": actual_hours - estimated_hours if actual_hours > 0 else 0
+            }
         
         return {
             "total_tasks": total_tasks,
@@ -521,33 +715,63 @@ class WorkplanManager:
     
     def save_workplan_data(self, save_path: str = "workplan_data.json"):
         """Save workplan data to JSON"""
+        # Categories reference their tasks by ID rather than repeating each task's
+        # fields; only the subtasks, which Task doesn't carry, are kept alongside
+        categories = {
+            name: {
+                **{key: value for key, value in category_data.items() if key != "tasks"},
+                "task_ids": [task_data["id"] for task_data in category_data.get("tasks", [])],
+                "subtasks": {
+                    task_data["id"]: task_data["subtasks"]
+                    for task_data in category_data.get("tasks", []) if task_data.get("subtasks")
+                }
+            }
+            for name, category_data in self.categories.items()
+        }
+        # Task enums are written as their values up front; any others go through
+        # the encoder's default hook
         data_to_save = {
-            "categories": self.categories,
-            "tasks": {task_id: asdict(task) for task_id, task in self.tasks.items()},
+            "categories": categories,
+            "tasks": {
+                task_id: {**task.to_dict(), "priority": task.priority.value, "status": task.status.value}
+                for task_id, task in self.tasks.items()
+            },
             "timeline_weeks": self.timeline_weeks,
             "last_updated": datetime.now().isoformat(),
             "excel_path": self.excel_path
         }
         
-        # Convert enums to strings for JSON serialization
-        for task_data in data_to_save["tasks"].values():
-            task_data["priority"] = task_data["priority"].value if hasattr(task_data["priority"], 'value') else str(task_data["priority"])
-            task_data["status"] = task_data["status"].value if hasattr(task_data["status"], 'value') else str(task_data["status"])
-        
-        with open(save_path, 'w') as f:
-            json.dump(data_to_save, f, indent=2, default=str)
+        if orjson is not None:
+            with open(save_path, 'wb') as f:
+                f.write(orjson.dumps(data_to_save, default=_json_default, option=orjson.OPT_INDENT_2))
+        else:
+            with open(save_path, 'w') as f:
+                json.dump(data_to_save, f, indent=2, default=_json_default)
+    
+    @staticmethod
+    def _category_task_entry(task: Task, subtasks: List[str]) -> Dict[str, Any]:
+        """Rebuild a category's task entry from its Task and saved subtasks"""
+        entry = {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "priority": task.priority,
+            "estimated_hours": task.estimated_hours,
+            "subtasks": subtasks
+        }
+        if task.dependencies:
+            entry["dependencies"] = task.dependencies
+        return entry
     
     def load_workplan_data_from_json(self, load_path: str = "workplan_data.json"):
         """Load saved workplan data"""
         if os.path.exists(load_path):
             try:
-                with open(load_path, 'r') as f:
-                    data = json.load(f)
+                with open(load_path, 'rb') as f:
+                    data = orjson.loads(f.read()) if orjson is not None else json.load(f)
                     
-                self.categories = data.get("categories", {})
-                self.timeline_weeks = data.get("timeline_weeks", [])
-                
                 # Reconstruct task objects
+                tasks = {}
                 tasks_data = data.get("tasks", {})
                 for task_id, task_data in tasks_data.items():
                     # Convert string enums back to enum objects
@@ -558,11 +782,11 @@ class WorkplanManager:
                         id=task_data["id"],
                         title=task_data["title"],
                         description=task_data["description"],
-                        category=task_data["category"],
+                        category=sys.intern(task_data["category"]),
                         priority=TaskPriority(priority_str) if isinstance(priority_str, str) else priority_str,
                         status=TaskStatus(status_str) if isinstance(status_str, str) else status_str,
-                        start_date=datetime.fromisoformat(task_data["start_date"]) if task_data.get("start_date") else None,
-                        end_date=datetime.fromisoformat(task_data["end_date"]) if task_data.get("end_date") else None,
+                        start_date=task_data.get("start_date") or None,  # Parsed on first read
+                        end_date=task_data.get("end_date") or None,
                         estimated_hours=task_data.get("estimated_hours"),
                         actual_hours=task_data.get("actual_hours"),
                         dependencies=task_data.get("dependencies", []),
@@ -570,8 +794,28 @@ class WorkplanManager:
                         completion_percentage=task_data.get("completion_percentage", 0.0),
                         notes=task_data.get("notes", "")
                     )
-                    self.tasks[task_id] = task
-                    
+                    tasks[task_id] = task
+                
+                categories = data.get("categories", {})
+                for category_data in categories.values():
+                    if "task_ids" in category_data:
+                        subtasks = category_data.pop("subtasks", {})
+                        category_data["tasks"] = [
+                            self._category_task_entry(tasks[task_id], subtasks.get(task_id, []))
+                            if task_id in tasks else {"id": task_id}
+                            for task_id in category_data.pop("task_ids")
+                        ]
+                
+                self.categories = categories
+                self.timeline_weeks = data.get("timeline_weeks", [])
+                for week in self.timeline_weeks:
+                    # Older saves wrote the boundaries as datetimes
+                    week["start_date"] = datetime.fromisoformat(week["start_date"]).date() if week.get("start_date") else None
+                    week["end_date"] = datetime.fromisoformat(week["end_date"]).date() if week.get("end_date") else None
+                self._index_timeline()
+                self.tasks = tasks
+                self._index_dependencies()
+                self._build_columns()
                 return True
             except Exception as e:
                 print(f"Error loading workplan data: {e}")
@@ -579,6 +823,12 @@ class WorkplanManager:
         return False
 
 # Helper function
+@functools.lru_cache(maxsize=None)
+def _cached_workplan_manager(excel_path: str) -> WorkplanManager:
+    """Build the workplan manager for a normalized Excel path"""
+    return WorkplanManager(excel_path or None)
+
 def initialize_workplan_manager(excel_path: str = None) -> WorkplanManager:
-    """Initialize workplan manager"""
-    return WorkplanManager(excel_path)
\ No newline at end of file
+    """Initialize workplan manager, once per Excel path"""
+    # Normalize so (), (None) and (excel_path=None) share one cache entry
+    return _cached_workplan_manager(excel_path or '')
\ No newline at end of file